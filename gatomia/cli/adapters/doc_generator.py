@@ -10,6 +10,7 @@ from typing import Dict, Any
 import time
 import asyncio
 import os
+import shutil
 import logging
 import sys
 
@@ -218,7 +219,7 @@ class CLIDocumentationGenerator:
                 module_tree = cluster_modules(leaf_nodes, components, backend_config)
                 file_manager.save_json(module_tree, first_module_tree_path)
             
-            file_manager.save_json(module_tree, module_tree_path)
+            shutil.copyfile(first_module_tree_path, module_tree_path)
             self.job.module_count = len(module_tree)
             
             if self.verbose:
@@ -4,6 +4,7 @@ Analyze command for code analysis only (no documentation generation).
 
 import sys
 import logging
+import shutil
 from pathlib import Path
 from typing import Optional
 import click
@@ -172,7 +173,7 @@ def analyze_command(
             }
         
         file_manager.save_json(module_tree, first_module_tree_path)
-        file_manager.save_json(module_tree, module_tree_path)
+        shutil.copyfile(first_module_tree_path, module_tree_path)
         
         logger.success(f"Created {len(module_tree)} modules")
         
@@ -32,9 +32,14 @@ class AnalysisService:
 
     """
 
-    def __init__(self):
-        """Initialize the analysis service with language-specific analyzers."""
-        self.call_graph_analyzer = CallGraphAnalyzer()
+    def __init__(self, cpp_cache_path: Optional[str] = None):
+        """
+        Initialize the analysis service with language-specific analyzers.
+
+        Args:
+            cpp_cache_path: SQLite file caching C++ analysis results across runs, if any
+        """
+        self.call_graph_analyzer = CallGraphAnalyzer(cpp_cache_path=cpp_cache_path)
         self._temp_directories = []
 
     def analyze_local_repository(
@@ -6,8 +6,11 @@ Coordinates language-specific analyzers to build comprehensive call graphs
 across different programming languages in a repository.
 """
 
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 from gatowiki.src.core.dependency_analyzer.models.core import Node, CallRelationship
 from gatowiki.src.core.dependency_analyzer.utils.patterns import CODE_EXTENSIONS
@@ -15,12 +18,110 @@ from gatowiki.src.core.dependency_analyzer.utils.security import safe_open_text
 
 logger = logging.getLogger(__name__)
 
+# Below this many files the process pool start-up (spawned workers re-import
+# the analyzers, ~0.5s) costs more than the parsing it would parallelize.
+PARALLEL_MIN_FILES = 128
+# Files handed to a worker per IPC round trip.
+PARALLEL_CHUNKSIZE = 16
+# Workers are spawned rather than forked: the web app creates the pool from a
+# process that already runs background threads, and forking those can
+# deadlock on locks they hold.
+PARALLEL_MP_CONTEXT = "spawn"
+
+
+def analyze_file(
+    language: str, file_path: str, content: str, repo_dir: str, cpp_cache_path: Optional[str] = None
+) -> Tuple[List[Node], List[CallRelationship]]:
+    """
+    Run the language-specific analyzer on a single file.
+
+    Kept at module level (and importing analyzers lazily) so it can be
+    pickled and executed in worker processes.
+
+    Args:
+        language: Language key from CODE_EXTENSIONS
+        file_path: Path to the file being analyzed
+        content: File content string
+        repo_dir: Repository base directory
+        cpp_cache_path: SQLite file caching C++ analysis results across runs, if any
+
+    Returns:
+        Tuple of (nodes, call_relationships); empty for unsupported languages
+    """
+    if language == "python":
+        from gatowiki.src.core.dependency_analyzer.analyzers.python import analyze_python_file
+
+        return analyze_python_file(file_path, content, repo_path=repo_dir)
+    elif language == "javascript":
+        from gatowiki.src.core.dependency_analyzer.analyzers.javascript import analyze_javascript_file_treesitter
+
+        return analyze_javascript_file_treesitter(file_path, content, repo_path=repo_dir)
+    elif language == "typescript":
+        from gatowiki.src.core.dependency_analyzer.analyzers.typescript import analyze_typescript_file_treesitter
+
+        return analyze_typescript_file_treesitter(file_path, content, repo_path=repo_dir)
+    elif language == "java":
+        from gatowiki.src.core.dependency_analyzer.analyzers.java import analyze_java_file
+
+        return analyze_java_file(file_path, content, repo_path=repo_dir)
+    elif language == "csharp":
+        from gatowiki.src.core.dependency_analyzer.analyzers.csharp import analyze_csharp_file
+
+        return analyze_csharp_file(file_path, content, repo_path=repo_dir)
+    elif language == "c":
+        from gatowiki.src.core.dependency_analyzer.analyzers.c import analyze_c_file
+
+        return analyze_c_file(file_path, content, repo_path=repo_dir)
+    elif language == "cpp":
+        from gatowiki.src.core.dependency_analyzer.analyzers.cpp import analyze_cpp_file, get_analysis_cache
+
+        cache = get_analysis_cache(cpp_cache_path) if cpp_cache_path else None
+        return analyze_cpp_file(file_path, content, repo_path=repo_dir, cache=cache)
+    return [], []
+
+
+def _analyze_file_job(
+    job: Tuple[str, str, str, Optional[str]]
+) -> Tuple[str, List[Node], List[CallRelationship]]:
+    """
+    Worker entry point: read and analyze one
+    ``(language, relative_path, repo_dir, cpp_cache_path)`` job.
+
+    The file is read here rather than by the caller, so only paths cross the
+    process boundary and the parent never holds every file's content at once.
+    """
+    language, relative_path, repo_dir, cpp_cache_path = job
+    base = Path(repo_dir)
+    target = base / relative_path
+    file_path = str(target)
+    try:
+        content = safe_open_text(base, target)
+    except Exception as e:
+        logger.error(f"⚠️ Error analyzing {file_path}: {str(e)}")
+        return file_path, [], []
+    try:
+        functions, relationships = analyze_file(language, file_path, content, repo_dir, cpp_cache_path)
+    except Exception as e:
+        logger.error(f"Failed to analyze {language} file {file_path}: {e}", exc_info=True)
+        return file_path, [], []
+    return file_path, functions, relationships
+
 
 class CallGraphAnalyzer:
-    def __init__(self):
-        """Initialize the call graph analyzer."""
+    def __init__(self, max_workers: Optional[int] = None, cpp_cache_path: Optional[str] = None):
+        """
+        Initialize the call graph analyzer.
+
+        Args:
+            max_workers: Number of worker processes used to parse files.
+                Defaults to the CPU count; 1 forces serial analysis.
+            cpp_cache_path: SQLite file in which C++ analysis results are cached
+                across runs, keyed by file content; None disables the cache.
+        """
         self.functions: Dict[str, Node] = {}
         self.call_relationships: List[CallRelationship] = []
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cpp_cache_path = cpp_cache_path
         logger.debug("CallGraphAnalyzer initialized.")
 
     def analyze_code_files(self, code_files: List[Dict], base_dir: str) -> Dict:
@@ -39,10 +140,13 @@ class CallGraphAnalyzer:
         self.call_relationships = []
 
         files_analyzed = 0
-        for file_info in code_files:
-            logger.debug(f"Analyzing: {file_info['path']}")
-            self._analyze_code_file(base_dir, file_info)
-            files_analyzed += 1
+        if self.max_workers > 1 and len(code_files) >= PARALLEL_MIN_FILES:
+            files_analyzed = self._analyze_code_files_parallel(code_files, base_dir)
+        else:
+            for file_info in code_files:
+                logger.debug(f"Analyzing: {file_info['path']}")
+                self._analyze_code_file(base_dir, file_info)
+                files_analyzed += 1
         logger.debug(
             f"Analysis complete: {files_analyzed} files analyzed, {len(self.functions)} functions, {len(self.call_relationships)} relationships"
         )
@@ -100,204 +204,83 @@ class CallGraphAnalyzer:
         traverse(file_tree)
         return code_files
 
-    def _analyze_code_file(self, repo_dir: str, file_info: Dict):
-        """
-        Analyze a single code file based on its language.
-
-        Routes to appropriate language-specific analyzer.
-
-        Args:
-            repo_dir: Repository directory path
-            file_info: File information dictionary
+    def _analyze_code_files_parallel(self, code_files: List[Dict], base_dir: str) -> int:
         """
+        Analyze code files across a pool of worker processes.
 
-        base = Path(repo_dir)
-        file_path = base / file_info["path"]
-
-        try:
-            content = safe_open_text(base, file_path)
-            language = file_info["language"]
-            if language == "python":
-                self._analyze_python_file(file_path, content, repo_dir)
-            elif language == "javascript":
-                self._analyze_javascript_file(file_path, content, repo_dir)
-            elif language == "typescript":
-                self._analyze_typescript_file(file_path, content, repo_dir)
-            elif language == "java":
-                self._analyze_java_file(file_path, content, repo_dir)
-            elif language == "csharp":
-                self._analyze_csharp_file(file_path, content, repo_dir)
-            elif language == "c":
-                self._analyze_c_file(file_path, content, repo_dir)
-            elif language == "cpp":
-                self._analyze_cpp_file(file_path, content, repo_dir)
-            # else:
-            #     logger.warning(
-            #         f"Unsupported language for call graph analysis: {language} for file {file_path}"
-            #     )
-
-        except Exception as e:
-            logger.error(f"⚠️ Error analyzing {file_path}: {str(e)}")
-
-    def _analyze_python_file(self, file_path: str, content: str, base_dir: str):
-        """
-        Analyze Python file using Python AST analyzer.
+        Workers read their own files; results are merged in submission order,
+        so the outcome matches a serial run. If the pool breaks (a worker dies
+        or a result cannot be pickled), the files not merged yet are analyzed
+        serially instead.
 
         Args:
-            file_path: Relative path to the Python file
-            content: File content string
+            code_files: File information dictionaries from extract_code_files
             base_dir: Repository base directory path
-        """
-        from gatowiki.src.core.dependency_analyzer.analyzers.python import analyze_python_file
-
-        try:
-            functions, relationships = analyze_python_file(
-                file_path, content, repo_path=base_dir
-            )
-
-            for func in functions:
-                func_id = func.id if func.id else f"{file_path}:{func.name}"
-                self.functions[func_id] = func
-
-            self.call_relationships.extend(relationships)
-        except Exception as e:
-            logger.error(f"Failed to analyze Python file {file_path}: {e}", exc_info=True)
 
-    def _analyze_javascript_file(self, file_path: str, content: str, repo_dir: str):
+        Returns:
+            Number of files analyzed
         """
-        Analyze JavaScript file using tree-sitter based AST analyzer
+        jobs = [
+            (file_info["language"], file_info["path"], base_dir, self.cpp_cache_path)
+            for file_info in code_files
+        ]
+        merged = 0
 
-        Args:
-            file_path: Relative path to the JavaScript file
-            content: File content string
-            repo_dir: Repository base directory
-        """
+        logger.debug(f"Analyzing {len(jobs)} files with {self.max_workers} worker processes")
         try:
-
-            from gatowiki.src.core.dependency_analyzer.analyzers.javascript import analyze_javascript_file_treesitter
-
-            functions, relationships = analyze_javascript_file_treesitter(
-                file_path, content, repo_path=repo_dir
-            )
-
-            for func in functions:
-                func_id = func.id if func.id else f"{file_path}:{func.name}"
-                self.functions[func_id] = func
-
-            self.call_relationships.extend(relationships)
-
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(PARALLEL_MP_CONTEXT),
+            ) as executor:
+                for file_path, functions, relationships in executor.map(
+                    _analyze_file_job, jobs, chunksize=PARALLEL_CHUNKSIZE
+                ):
+                    self._add_file_results(file_path, functions, relationships)
+                    merged += 1
         except Exception as e:
-            logger.error(f"Failed to analyze JavaScript file {file_path}: {e}", exc_info=True)
-
-    def _analyze_typescript_file(self, file_path: str, content: str, repo_dir: str):
-        """
-        Analyze TypeScript file using tree-sitter based AST analyzer 
-
-        Args:
-            file_path: Relative path to the TypeScript file
-            content: File content string
-        """
-        try:
-
-            from gatowiki.src.core.dependency_analyzer.analyzers.typescript import analyze_typescript_file_treesitter
-
-            functions, relationships = analyze_typescript_file_treesitter(
-                file_path, content, repo_path=repo_dir
+            # per-file analyzer errors are handled inside _analyze_file_job, so
+            # anything raised here is the pool itself (BrokenProcessPool,
+            # an unpicklable result, failure to start workers)
+            logger.warning(
+                f"Process pool failed after {merged} of {len(jobs)} files ({e}); analyzing the rest serially"
             )
+            for job in jobs[merged:]:
+                self._add_file_results(*_analyze_file_job(job))
 
-            for func in functions:
-                func_id = func.id if func.id else f"{file_path}:{func.name}"
-                self.functions[func_id] = func
-
-            self.call_relationships.extend(relationships)
+        return len(code_files)
 
-        except Exception as e:
-            logger.error(f"Failed to analyze TypeScript file {file_path}: {e}", exc_info=True)
-
-
-
-    def _analyze_c_file(self, file_path: str, content: str, repo_dir: str):
+    def _analyze_code_file(self, repo_dir: str, file_info: Dict):
         """
-        Analyze C file using tree-sitter based analyzer.
+        Analyze a single code file based on its language.
+
+        Routes to appropriate language-specific analyzer.
 
         Args:
-            file_path: Relative path to the C file
-            content: File content string
-            repo_dir: Repository base directory
+            repo_dir: Repository directory path
+            file_info: File information dictionary
         """
-        from gatowiki.src.core.dependency_analyzer.analyzers.c import analyze_c_file
-
-        functions, relationships = analyze_c_file(file_path, content, repo_path=repo_dir)
-
-        for func in functions:
-            func_id = func.id if func.id else f"{file_path}:{func.name}"
-            self.functions[func_id] = func
-
-        self.call_relationships.extend(relationships)
+        file_path, functions, relationships = _analyze_file_job(
+            (file_info["language"], file_info["path"], repo_dir, self.cpp_cache_path)
+        )
+        self._add_file_results(file_path, functions, relationships)
 
-    def _analyze_cpp_file(self, file_path: str, content: str, repo_dir: str):
+    def _add_file_results(
+        self, file_path: str, functions: List[Node], relationships: List[CallRelationship]
+    ):
         """
-        Analyze C++ file using tree-sitter based analyzer.
+        Merge the nodes and relationships produced for one file.
 
         Args:
-            file_path: Relative path to the C++ file
-            content: File content string
+            file_path: Path of the analyzed file
+            functions: Nodes extracted from the file
+            relationships: Call relationships extracted from the file
         """
-        from gatowiki.src.core.dependency_analyzer.analyzers.cpp import analyze_cpp_file
-
-        functions, relationships = analyze_cpp_file(
-            file_path, content, repo_path=repo_dir
-        )
-
         for func in functions:
             func_id = func.id if func.id else f"{file_path}:{func.name}"
             self.functions[func_id] = func
 
         self.call_relationships.extend(relationships)
 
-    def _analyze_java_file(self, file_path: str, content: str, repo_dir: str):
-        """
-        Analyze Java file using tree-sitter based analyzer.
-
-        Args:
-            file_path: Relative path to the Java file
-            content: File content string
-            repo_dir: Repository base directory
-        """
-        from gatowiki.src.core.dependency_analyzer.analyzers.java import analyze_java_file
-
-        try:
-            functions, relationships = analyze_java_file(file_path, content, repo_path=repo_dir)
-            for func in functions:
-                func_id = func.id if func.id else f"{file_path}:{func.name}"
-                self.functions[func_id] = func
-
-            self.call_relationships.extend(relationships)
-        except Exception as e:
-            logger.error(f"Failed to analyze Java file {file_path}: {e}", exc_info=True)
-
-    def _analyze_csharp_file(self, file_path: str, content: str, repo_dir: str):
-        """
-        Analyze C# file using tree-sitter based analyzer.
-
-        Args:
-            file_path: Relative path to the C# file
-            content: File content string
-            repo_dir: Repository base directory
-        """
-        from gatowiki.src.core.dependency_analyzer.analyzers.csharp import analyze_csharp_file
-
-        try:
-            functions, relationships = analyze_csharp_file(file_path, content, repo_path=repo_dir)
-
-            for func in functions:
-                func_id = func.id if func.id else f"{file_path}:{func.name}"
-                self.functions[func_id] = func
-
-            self.call_relationships.extend(relationships)
-        except Exception as e:
-            logger.error(f"Failed to analyze C# file {file_path}: {e}", exc_info=True)
-
     def _resolve_call_relationships(self):
         """
         Resolve function call relationships across all languages.
@@ -17,17 +17,13 @@ class TreeSitterCAnalyzer:
 		self.repo_path = repo_path or ""
 		self.nodes: List[Node] = []
 		self.call_relationships: List[CallRelationship] = []
+		# both paths are fixed per file; compute them once instead of per node
+		self._relative_path = self._get_relative_path()
+		self._module_path = self._get_module_path()
 		self._analyze()
 	
 	def _get_module_path(self) -> str:
-		if self.repo_path:
-			try:
-				rel_path = os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				rel_path = str(self.file_path)
-		else:
-			rel_path = str(self.file_path)
-		
+		rel_path = self._relative_path
 		for ext in ['.c', '.h']:
 			if rel_path.endswith(ext):
 				rel_path = rel_path[:-len(ext)]
@@ -35,16 +31,21 @@ class TreeSitterCAnalyzer:
 		return rel_path.replace('/', '.').replace('\\', '.')
 	
 	def _get_relative_path(self) -> str:
-		if self.repo_path:
-			try:
-				return os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				return str(self.file_path)
-		else:
-			return str(self.file_path)
+		file_path = str(self.file_path)
+		if not self.repo_path:
+			return file_path
+		# fast path: file paths handed in by the call graph analyzer are
+		# already joined onto repo_path, so a prefix strip is enough
+		prefix = self.repo_path.rstrip('/\\') + os.sep
+		if file_path.startswith(prefix):
+			return file_path[len(prefix):]
+		try:
+			return os.path.relpath(file_path, self.repo_path)
+		except ValueError:
+			return file_path
 	
 	def _get_component_id(self, name: str) -> str:
-		module_path = self._get_module_path()
+		module_path = self._module_path
 		return f"{module_path}.{name}" if module_path else name
 
 	def _analyze(self):
@@ -55,16 +56,31 @@ class TreeSitterCAnalyzer:
 		root = tree.root_node
 		lines = self.content.splitlines()
 		
-		top_level_nodes = {}
+		# collect all top-level definitions using recursive traversal, then
+		# build their Node objects in one batch
+		matches = []
+		self._extract_nodes(root, matches)
+		built = [self._build_node(node, node_type, node_name, lines) for node, node_type, node_name in matches]
 		
-		# collect all top-level nodes using recursive traversal
-		self._extract_nodes(root, top_level_nodes, lines)
+		top_level_nodes = {node_obj.name: node_obj for node_obj in built}
+		# functions are also indexed by their byte span so containing-function
+		# lookups can match tree nodes without decoding their names again
+		functions_by_range = {
+			(match[0].start_byte, match[0].end_byte): node_obj
+			for match, node_obj in zip(matches, built)
+			if match[1] == "function"
+		}
+		self.nodes = [node_obj for node_obj in built if node_obj.component_type in ("function", "struct")]
 		
 		# extract relationships between top-level nodes
-		self._extract_relationships(root, top_level_nodes)
+		self._extract_relationships(root, top_level_nodes, functions_by_range)
 	
-	def _extract_nodes(self, node, top_level_nodes, lines):
-		"""Recursively extract top-level nodes (functions, structs, and global variables)."""
+	def _extract_nodes(self, node, matches, in_function=False):
+		"""Recursively collect top-level definitions (functions, structs, and global variables).
+
+		Appends ``(tree_node, node_type, node_name)`` tuples to ``matches`` in source order.
+		``in_function`` is set below a function_definition, where declarations are locals.
+		"""
 		node_type = None
 		node_name = None
 		
@@ -94,116 +110,113 @@ class TreeSitterCAnalyzer:
 				type_declarator = next((c for c in node.children if c.type == "type_identifier"), None)
 				if type_declarator:
 					node_name = type_declarator.text.decode()
-		elif node.type == "declaration":
-			if self._is_global_variable(node):
-				node_type = "variable"
-				for child in node.children:
-					if child.type == "init_declarator":
-						identifier = next((c for c in child.children if c.type == "identifier"), None)
+		elif node.type == "declaration" and not in_function:
+			# outside every function body, so this is a global variable
+			node_type = "variable"
+			for child in node.children:
+				if child.type == "init_declarator":
+					identifier = next((c for c in child.children if c.type == "identifier"), None)
+					if identifier:
+						node_name = identifier.text.decode()
+						break
+					pointer_declarator = next((c for c in child.children if c.type == "pointer_declarator"), None)
+					if pointer_declarator:
+						identifier = next((c for c in pointer_declarator.children if c.type == "identifier"), None)
 						if identifier:
 							node_name = identifier.text.decode()
 							break
-						pointer_declarator = next((c for c in child.children if c.type == "pointer_declarator"), None)
-						if pointer_declarator:
-							identifier = next((c for c in pointer_declarator.children if c.type == "identifier"), None)
-							if identifier:
-								node_name = identifier.text.decode()
-								break
-					elif child.type == "identifier":
-						node_name = child.text.decode()
-						break
+				elif child.type == "identifier":
+					node_name = child.text.decode()
+					break
 		
 		if node_type and node_name:
-			component_id = self._get_component_id(node_name)
-			relative_path = self._get_relative_path()
-			node_obj = Node(
-				id=component_id,
-				name=node_name,
-				component_type=node_type,
-				file_path=str(self.file_path),
-				relative_path=relative_path,
-				source_code="\n".join(lines[node.start_point[0]:node.end_point[0]+1]),
-				start_line=node.start_point[0]+1,
-				end_line=node.end_point[0]+1,
-				has_docstring=False,
-				docstring="",
-				parameters=None,
-				node_type=node_type,
-				base_classes=None,
-				class_name=None,
-				display_name=f"{node_type} {node_name}",
-				component_id=component_id
-			)
-
-			if node_type in ["function", "struct"]:
-				self.nodes.append(node_obj)
-			top_level_nodes[node_name] = node_obj
+			matches.append((node, node_type, node_name))
 		
+		# Function bodies are still searched: structs and typedefs declared in
+		# them (and GNU nested functions) are reported as nodes as well
+		in_function = in_function or node.type == "function_definition"
 		for child in node.children:
-			self._extract_nodes(child, top_level_nodes, lines)
+			self._extract_nodes(child, matches, in_function)
 	
-	def _is_global_variable(self, node) -> bool:
-		parent = node.parent
-		while parent:
-			if parent.type == "function_definition":
-				return False
-			parent = parent.parent
-		return True
+	def _build_node(self, node, node_type, node_name, lines) -> Node:
+		component_id = self._get_component_id(node_name)
+		return Node.model_construct(
+			id=component_id,
+			name=node_name,
+			component_type=node_type,
+			file_path=str(self.file_path),
+			relative_path=self._relative_path,
+			source_code="\n".join(lines[node.start_point[0]:node.end_point[0]+1]),
+			start_line=node.start_point[0]+1,
+			end_line=node.end_point[0]+1,
+			has_docstring=False,
+			docstring="",
+			parameters=None,
+			node_type=node_type,
+			base_classes=None,
+			class_name=None,
+			display_name=f"{node_type} {node_name}",
+			component_id=component_id
+		)
 	
-	def _extract_relationships(self, node, top_level_nodes):
-		"""Extract various types of relationships between top-level nodes."""
-		
-		# 1. function calls other functions
-		if node.type == "call_expression":
-			containing_function = self._find_containing_function(node, top_level_nodes)
-			if containing_function:
-				containing_function_id = self._get_component_id(containing_function)
-				
-				# Get called function name
-				function_node = next((c for c in node.children if c.type == "identifier"), None)
-				if function_node:
-					called_function = function_node.text.decode()
-					if not self._is_system_function(called_function):
-						self.call_relationships.append(CallRelationship(
+	def _extract_relationships(self, root, top_level_nodes, functions_by_range):
+		"""Extract various types of relationships between top-level nodes.
+
+		Walks the tree iteratively in pre-order so large files don't pay for a
+		Python call frame per tree node.
+		"""
+		stack = [root]
+		while stack:
+			node = stack.pop()
+			node_type = node.type
+			
+			# 1. function calls other functions
+			if node_type == "call_expression":
+				containing_function = self._find_containing_function(node, functions_by_range)
+				if containing_function:
+					containing_function_id = containing_function.id
+					
+					# Get called function name
+					function_node = next((c for c in node.children if c.type == "identifier"), None)
+					if function_node:
+						called_function = function_node.text.decode()
+						if not self._is_system_function(called_function):
+							self.call_relationships.append(CallRelationship.model_construct(
+								caller=containing_function_id,
+								callee=called_function,  # Use simple name for cross-file resolution
+								call_line=node.start_point[0]+1,
+								is_resolved=False  # Let CallGraphAnalyzer resolve
+							))
+			
+			# 2. function uses global variables
+			elif node_type == "identifier":
+				containing_function = self._find_containing_function(node, functions_by_range)
+				if containing_function:
+					var_name = node.text.decode()
+					# Check if this identifier refers to a global variable
+					if var_name in top_level_nodes and top_level_nodes[var_name].component_type == "variable":
+						containing_function_id = containing_function.id
+						var_component_id = self._get_component_id(var_name)
+						self.call_relationships.append(CallRelationship.model_construct(
 							caller=containing_function_id,
-							callee=called_function,  # Use simple name for cross-file resolution
+							callee=var_component_id,
 							call_line=node.start_point[0]+1,
-							is_resolved=False  # Let CallGraphAnalyzer resolve
+							is_resolved=True  # Local file relationship
 						))
-		
-		# 2. function uses global variables
-		if node.type == "identifier":
-			containing_function = self._find_containing_function(node, top_level_nodes)
-			if containing_function:
-				var_name = node.text.decode()
-				# Check if this identifier refers to a global variable
-				if var_name in top_level_nodes and top_level_nodes[var_name].component_type == "variable":
-					containing_function_id = self._get_component_id(containing_function)
-					var_component_id = self._get_component_id(var_name)
-					self.call_relationships.append(CallRelationship(
-						caller=containing_function_id,
-						callee=var_component_id,
-						call_line=node.start_point[0]+1,
-						is_resolved=True  # Local file relationship
-					))
-		
-		# Recursively process children
-		for child in node.children:
-			self._extract_relationships(child, top_level_nodes)
+			
+			# Push children reversed so they are visited in source order
+			children = node.children
+			if children:
+				stack.extend(reversed(children))
 	
-	def _find_containing_function(self, node, top_level_nodes):
-		"""Find the function that contains this node."""
+	def _find_containing_function(self, node, functions_by_range) -> Optional[Node]:
+		"""Find the function Node that contains this node, matched by byte span."""
 		current = node.parent
 		while current:
 			if current.type == "function_definition":
-				# Get function name
-				declarator = next((c for c in current.children if c.type == "function_declarator"), None)
-				if declarator:
-					identifier = next((c for c in declarator.children if c.type == "identifier"), None)
-					if identifier:
-						func_name = identifier.text.decode()
-						if func_name in top_level_nodes:
-							return func_name
+				func_node = functions_by_range.get((current.start_byte, current.end_byte))
+				if func_node:
+					return func_node
 			current = current.parent
 		return None
 	
@@ -1,8 +1,11 @@
+import hashlib
+import json
 import logging
-from typing import List, Optional, Tuple
-from pathlib import Path
+import sqlite3
+from typing import Dict, List, Optional, Set, Tuple
 import sys
 import os
+import threading
 
 from tree_sitter import Parser, Language
 import tree_sitter_cpp
@@ -10,24 +13,62 @@ from gatowiki.src.core.dependency_analyzer.models.core import Node, CallRelation
 
 logger = logging.getLogger(__name__)
 
+# Language objects are immutable and shared by every parser, in any thread
+_CPP_LANGUAGE = Language(tree_sitter_cpp.language())
+
+# A Parser is reusable across files but must not run two parses at once, so
+# each thread lazily gets its own.
+_parser_tls = threading.local()
+
+
+def _get_cpp_parser() -> Parser:
+	parser = getattr(_parser_tls, "parser", None)
+	if parser is None:
+		parser = _parser_tls.parser = Parser(_CPP_LANGUAGE)
+	return parser
+
+# Parents under which an identifier names a declaration rather than referencing a variable
+_NON_REFERENCE_PARENT_TYPES = frozenset({"function_definition", "class_specifier", "declaration", "function_declarator"})
+
+# Subtrees that never contain declarations or relationship sources; the walk
+# does not descend into them
+_SKIP_TYPES = frozenset({
+	'comment', 'string_literal', 'raw_string_literal', 'preproc_def',
+	'preproc_include', 'number_literal', 'char_literal'
+})
+
+# System/library functions that are never recorded as call targets
+_SYSTEM_FUNCTIONS = frozenset({
+	'printf', 'scanf', 'malloc', 'free', 'strlen', 'strcpy', 'strcmp',
+	'cout', 'cin', 'endl', 'std', 'new', 'delete'
+})
+
+# Any declaration inside one of these (named or not) is not a global variable
+_LOCAL_SCOPE_TYPES = frozenset({"function_definition", "class_specifier", "struct_specifier"})
+
+# Class body members that can declare or define a method
+_METHOD_MEMBER_TYPES = frozenset({"function_definition", "field_declaration", "declaration"})
+
 class TreeSitterCppAnalyzer:
 	def __init__(self, file_path: str, content: str, repo_path: str = None):
-		self.file_path = Path(file_path)
+		self.file_path = file_path
 		self.content = content
 		self.repo_path = repo_path or ""
 		self.nodes: List[Node] = []
 		self.call_relationships: List[CallRelationship] = []
+		# (caller, callee) already emitted; repeats keep the first line only. The
+		# relationship type is not part of the key: CallRelationship does not
+		# store it, so edges differing only by type would serialize identically.
+		self._edge_seen: Set[Tuple[str, str]] = set()
+		# fixed per file; compute them once instead of per node/relationship.
+		# str() is a no-op for the usual str argument and still accepts a Path.
+		self._file_path_str = str(file_path)
+		self._relative_path = self._get_relative_path()
+		self._module_path = self._get_module_path()
 		self._analyze()
 	
 	def _get_module_path(self) -> str:
-		if self.repo_path:
-			try:
-				rel_path = os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				rel_path = str(self.file_path)
-		else:
-			rel_path = str(self.file_path)
-
+		rel_path = self._relative_path
 		for ext in ['.cpp', '.cc', '.cxx', '.hpp', '.h']:
 			if rel_path.endswith(ext):
 				rel_path = rel_path[:-len(ext)]
@@ -35,334 +76,432 @@ class TreeSitterCppAnalyzer:
 		return rel_path.replace('/', '.').replace('\\', '.')
 	
 	def _get_relative_path(self) -> str:
-		if self.repo_path:
-			try:
-				return os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				return str(self.file_path)
-		else:
-			return str(self.file_path)
+		file_path = self._file_path_str
+		if not self.repo_path:
+			return file_path
+		# fast path: file paths handed in by the call graph analyzer are
+		# already joined onto repo_path, so a prefix strip is enough
+		prefix = self.repo_path.rstrip('/\\') + os.sep
+		if file_path.startswith(prefix):
+			return file_path[len(prefix):]
+		try:
+			return os.path.relpath(file_path, self.repo_path)
+		except ValueError:
+			return file_path
 	
 	def _get_component_id(self, name: str, parent_class: str = None) -> str:
-		module_path = self._get_module_path()
+		module_path = self._module_path
 		if parent_class:
 			return f"{module_path}.{parent_class}.{name}" if module_path else f"{parent_class}.{name}"
 		return f"{module_path}.{name}" if module_path else name
 
 	def _analyze(self):
-		language_capsule = tree_sitter_cpp.language()
-		cpp_language = Language(language_capsule)
-		parser = Parser(cpp_language)
-		tree = parser.parse(bytes(self.content, "utf8"))
-		root = tree.root_node
-		lines = self.content.splitlines()
+		self.source_bytes = bytes(self.content, "utf8")
+		tree = _get_cpp_parser().parse(self.source_bytes)
 		
 		top_level_nodes = {}
+		# method name -> name of the first class/struct declaring it
+		self._method_to_class = {}
 		
-		# collect all top-level nodes using recursive traversal
-		self._extract_nodes(root, top_level_nodes, lines)
+		# single pass: emits nodes and collects relationship records
+		records = self._walk(tree, top_level_nodes)
 		
-		# extract relationships between top-level nodes
-		self._extract_relationships(root, top_level_nodes)
+		# Relationship targets depend on every top-level node in the file,
+		# including ones declared after the reference, so resolve them here.
+		# Identifier references can only resolve to global variables.
+		self._has_global_vars = any(n.component_type == "variable" for n in top_level_nodes.values())
+		for record in records:
+			if record[0] == "uses" and not self._has_global_vars:
+				continue
+			self._resolve_record(record, top_level_nodes)
 	
-	def _extract_nodes(self, node, top_level_nodes, lines):
-		"""Recursively extract top-level nodes (classes, functions, global variables)."""
-		node_type = None
-		node_name = None
+	def _walk(self, tree, top_level_nodes):
+		"""Visit every tree node once with a TreeCursor, tracking the enclosing classes and functions.
 		
-		if node.type == "class_specifier":
-			# "class" + type_identifier + { ... }
-			node_type = "class"
-			# Find type_identifier that represents the class name
-			for child in node.children:
-				if child.type == "type_identifier":
-					node_name = child.text.decode()
-					break
-		elif node.type == "struct_specifier":
-			# "struct" + type_identifier + { ... }
-			node_type = "struct"
-			# Find type_identifier that represents the struct name
-			for child in node.children:
-				if child.type == "type_identifier":
-					node_name = child.text.decode()
-					break
-		elif node.type == "function_definition":
-			# Check if this is inside a class or function
-			containing_class = self._find_containing_class_for_method(node)
-			if containing_class:
-				node_type = "method"
-			else:
-				node_type = "function"
+		Nodes are added to top_level_nodes (and self.nodes) as they are reached. Returns
+		relationship records in source order as (kind, caller, target, line) tuples; for
+		"uses" records target is the identifier node, decoded only when resolved.
+		"""
+		records = []
+		# (depth, name) of the enclosing named class_specifier/struct_specifier
+		# declarations, and of the enclosing class_specifier declarations only
+		class_or_struct_stack = []
+		class_stack = []
+		# (depth, name) of the enclosing function definitions named by a plain identifier
+		func_stack = []
+		# depths of every enclosing function/class/struct, including unnamed ones
+		local_scope_depths = []
+		# node type at each depth of the current path, for parent lookups
+		type_path = []
+		
+		cursor = tree.walk()
+		depth = 0
+		while True:
+			node = cursor.node
+			node_type = node.type
+			del type_path[depth:]
+			type_path.append(node_type)
+			if node_type in _LOCAL_SCOPE_TYPES:
+				local_scope_depths.append(depth)
 			
-			declarator = next((c for c in node.children if c.type == "function_declarator"), None)
-			if declarator:
-				for child in declarator.children:
-					if child.type == "identifier":
-						node_name = child.text.decode()
-						break
-					elif child.type == "field_identifier":
-						node_name = child.text.decode()
+			if node_type == "class_specifier" or node_type == "struct_specifier":
+				# "class"/"struct" + type_identifier + { ... }
+				node_name = None
+				body = None
+				for child in node.children:
+					if child.type == "type_identifier":
+						if node_name is None:
+							node_name = child.text.decode()
+					elif child.type == "field_declaration_list":
+						body = child
+				if node_name:
+					self._add_node(node, "class" if node_type == "class_specifier" else "struct",
+						node_name, None, top_level_nodes)
+					if body:
+						self._index_methods(body, node_name)
+					class_or_struct_stack.append((depth, node_name))
+					if node_type == "class_specifier":
+						class_stack.append((depth, node_name))
+			
+			elif node_type == "function_definition":
+				containing_class = class_or_struct_stack[-1][1] if class_or_struct_stack else None
+				declarator = None
+				for child in node.children:
+					if child.type == "function_declarator":
+						declarator = child
 						break
-					elif child.type == "qualified_identifier":
-						identifiers = [c for c in child.children if c.type == "identifier"]
-						if identifiers:
-							node_name = identifiers[-1].text.decode()
+				if declarator:
+					node_name = None
+					for child in declarator.children:
+						child_type = child.type
+						if child_type == "identifier" or child_type == "field_identifier":
+							node_name = child.text.decode()
 							break
-		elif node.type == "declaration":
-			if self._is_global_variable(node):
-				node_type = "variable"
-				for child in node.children:
-					if child.type == "init_declarator":
-						identifier = next((c for c in child.children if c.type == "identifier"), None)
-						if identifier:
-							node_name = identifier.text.decode()
+						elif child_type == "qualified_identifier":
+							identifiers = [c for c in child.children if c.type == "identifier"]
+							if identifiers:
+								node_name = identifiers[-1].text.decode()
+								break
+					if node_name:
+						if containing_class:
+							self._add_node(node, "method", node_name, containing_class, top_level_nodes)
+						else:
+							self._add_node(node, "function", node_name, None, top_level_nodes)
+					
+					# only functions named by a plain identifier are callers
+					for child in declarator.children:
+						if child.type == "identifier":
+							func_stack.append((depth, child.text.decode()))
 							break
-					elif child.type == "identifier":
-						node_name = child.text.decode()
-						break
-		elif node.type == "namespace_definition":
-			node_type = "namespace"
-			found_namespace_keyword = False
-			for child in node.children:
-				if child.type == "namespace":
-					found_namespace_keyword = True
-				elif found_namespace_keyword and child.type == "identifier":
-					node_name = child.text.decode()
-					break
-		
-		if node_type and node_name:
-			if node_type == "method":
-				component_id = self._get_component_id(node_name, containing_class)
-				top_level_key = component_id
-			else:
-				component_id = self._get_component_id(node_name)
-				top_level_key = node_name
-				
-			relative_path = self._get_relative_path()
-			
-			node_obj = Node(
-				id=component_id,
-				name=node_name,
-				component_type=node_type,
-				file_path=str(self.file_path),
-				relative_path=relative_path,
-				source_code="\n".join(lines[node.start_point[0]:node.end_point[0]+1]),
-				start_line=node.start_point[0]+1,
-				end_line=node.end_point[0]+1,
-				has_docstring=False,
-				docstring="",
-				parameters=None,
-				node_type=node_type,
-				base_classes=None,
-				class_name=containing_class if node_type == "method" else None,
-				display_name=f"{node_type} {node_name}",
-				component_id=component_id
-			)
 			
-			top_level_nodes[top_level_key] = node_obj
+			elif node_type == "declaration":
+				if not local_scope_depths:
+					node_name = None
+					for child in node.children:
+						if child.type == "init_declarator":
+							identifier = next((c for c in child.children if c.type == "identifier"), None)
+							if identifier:
+								node_name = identifier.text.decode()
+								break
+						elif child.type == "identifier":
+							node_name = child.text.decode()
+							break
+					if node_name:
+						self._add_node(node, "variable", node_name, None, top_level_nodes)
 			
-			if node_type in ["class", "struct", "function"]:
-				self.nodes.append(node_obj)
-		
-		# Recursively process children
-		for child in node.children:
-			self._extract_nodes(child, top_level_nodes, lines)
-
-	def _is_global_variable(self, node) -> bool:
-		"""Check if a declaration node is a global variable."""
-		parent = node.parent
-		while parent:
-			if parent.type in ["function_definition", "class_specifier", "struct_specifier"]:
-				return False
-			parent = parent.parent
-		return True
-
-	def _find_containing_class_for_method(self, node):
-		"""Find the class that contains this method definition."""
-		current = node.parent
-		while current:
-			if current.type == "class_specifier":
-				# Get class name
-				for child in current.children:
-					if child.type == "type_identifier":
-						return child.text.decode()
-			elif current.type == "struct_specifier":
-				# Get struct name 
-				for child in current.children:
-					if child.type == "type_identifier":
-						return child.text.decode()
-			current = current.parent
-		return None
-
-	def _extract_relationships(self, node, top_level_nodes):
-		if node.type == "call_expression":
-			containing_function = self._find_containing_function_or_method(node, top_level_nodes)
-			if containing_function:
-				containing_function_id = self._get_component_id_for_function(containing_function, top_level_nodes)
-				
-				# Get called function name 
-				called_function = None
+			elif node_type == "namespace_definition":
+				found_namespace_keyword = False
 				for child in node.children:
-					if child.type == "identifier":
-						called_function = child.text.decode()
+					if child.type == "namespace":
+						found_namespace_keyword = True
+					elif found_namespace_keyword and child.type == "identifier":
+						self._add_node(node, "namespace", child.text.decode(), None, top_level_nodes)
 						break
-					elif child.type == "field_expression":
-						method_name = None
-						for field_child in child.children:
-							if field_child.type == "field_identifier":
-								method_name = field_child.text.decode()
-								break
-						if method_name:
-							called_function = method_name
+			
+			elif node_type == "call_expression":
+				if func_stack:
+					# Get called function name 
+					called_function = None
+					for child in node.children:
+						if child.type == "identifier":
+							called_function = child.text.decode()
 							break
-				
-				if called_function and not self._is_system_function(called_function):
-					target_class = self._find_class_containing_method(called_function, top_level_nodes)
+						elif child.type == "field_expression":
+							method_name = None
+							for field_child in child.children:
+								if field_child.type == "field_identifier":
+									method_name = field_child.text.decode()
+									break
+							if method_name:
+								called_function = method_name
+								break
 					
-					if target_class:
-						target_class_id = self._get_component_id(target_class)
-						self.call_relationships.append(CallRelationship(
-							caller=containing_function_id,
-							callee=target_class_id,
-							call_line=node.start_point[0]+1,
-							relationship_type="calls"
-						))
-					elif called_function in top_level_nodes:
-						called_function_id = self._get_component_id(called_function)
-						self.call_relationships.append(CallRelationship(
-							caller=containing_function_id,
-							callee=called_function_id,
-							call_line=node.start_point[0]+1,
-							relationship_type="calls"
-						))
+					if called_function and not self._is_system_function(called_function):
+						records.append(("calls", func_stack[-1][1], called_function, node.start_point[0]+1))
+			
+			elif node_type == "base_class_clause":
+				if class_stack:
+					containing_class = class_stack[-1][1]
+					for child in node.children:
+						if child.type == "type_identifier":
+							records.append(("inherits", containing_class, child.text.decode(), node.start_point[0]+1))
+			
+			elif node_type == "new_expression":
+				if func_stack:
+					# Get the class being instantiated
+					for child in node.children:
+						if child.type == "type_identifier":
+							records.append(("creates", func_stack[-1][1], child.text.decode(), node.start_point[0]+1))
+							break
+			
+			elif node_type == "identifier":
+				if func_stack and depth and type_path[depth-1] not in _NON_REFERENCE_PARENT_TYPES:
+					records.append(("uses", func_stack[-1][1], node, node.start_point[0]+1))
+			
+			if node_type not in _SKIP_TYPES and cursor.goto_first_child():
+				depth += 1
+				continue
+			
+			# leave finished nodes until one has a next sibling
+			while True:
+				while class_or_struct_stack and class_or_struct_stack[-1][0] == depth:
+					class_or_struct_stack.pop()
+				while class_stack and class_stack[-1][0] == depth:
+					class_stack.pop()
+				while func_stack and func_stack[-1][0] == depth:
+					func_stack.pop()
+				if local_scope_depths and local_scope_depths[-1] == depth:
+					local_scope_depths.pop()
+				if cursor.goto_next_sibling():
+					break
+				if not cursor.goto_parent():
+					return records
+				depth -= 1
+	
+	def _index_methods(self, body, class_name):
+		"""Record the methods a class body declares or defines in self._method_to_class."""
+		for member in body.children:
+			if member.type == "template_declaration":
+				member = next((c for c in member.children if c.type in _METHOD_MEMBER_TYPES), None)
+				if member is None:
+					continue
+			elif member.type not in _METHOD_MEMBER_TYPES:
+				continue
+			for child in member.children:
+				if child.type == "function_declarator":
+					# members are named by a field_identifier, templated ones by an identifier
+					for declarator_child in child.children:
+						if declarator_child.type == "field_identifier" or declarator_child.type == "identifier":
+							self._method_to_class.setdefault(declarator_child.text.decode(), class_name)
+							break
+					break
+	
+	def _add_node(self, node, node_type, node_name, containing_class, top_level_nodes):
+		"""Emit a node; methods are keyed by component id, everything else by name."""
+		if node_type == "method":
+			component_id = self._get_component_id(node_name, containing_class)
+			top_level_key = component_id
+		else:
+			component_id = self._get_component_id(node_name)
+			top_level_key = node_name
 		
-		elif node.type == "base_class_clause":
-			# Find the containing class
-			containing_class = self._find_containing_class(node)
-			if containing_class:
-				# Extract base class names
-				for child in node.children:
-					if child.type == "type_identifier":
-						base_class = child.text.decode()
-						containing_class_id = self._get_component_id(containing_class)
-						self.call_relationships.append(CallRelationship(
-							caller=containing_class_id,
-							callee=base_class,
-							call_line=node.start_point[0]+1,
-							relationship_type="inherits"
-						))
+		node_obj = Node(
+			id=component_id,
+			name=node_name,
+			component_type=node_type,
+			file_path=self._file_path_str,
+			relative_path=self._relative_path,
+			source_code=self._get_source_lines(node),
+			start_line=node.start_point[0]+1,
+			end_line=node.end_point[0]+1,
+			has_docstring=False,
+			docstring="",
+			parameters=None,
+			node_type=node_type,
+			base_classes=None,
+			class_name=containing_class if node_type == "method" else None,
+			display_name=f"{node_type} {node_name}",
+			component_id=component_id
+		)
 		
-		elif node.type == "new_expression":
-			containing_function = self._find_containing_function_or_method(node, top_level_nodes)
-			if containing_function:
-				containing_function_id = self._get_component_id_for_function(containing_function, top_level_nodes)
-				
-				# Get the class being instantiated
-				for child in node.children:
-					if child.type == "type_identifier":
-						class_name = child.text.decode()
-						if class_name in top_level_nodes:
-							class_id = self._get_component_id(class_name)
-							self.call_relationships.append(CallRelationship(
-								caller=containing_function_id,
-								callee=class_id,
-								call_line=node.start_point[0]+1,
-								relationship_type="creates"
-							))
-						break
+		top_level_nodes[top_level_key] = node_obj
 		
-		elif node.type == "identifier":
-			parent = node.parent
-			if parent and parent.type not in ["function_definition", "class_specifier", "declaration", "function_declarator"]:
-				var_name = node.text.decode()
-				if var_name in top_level_nodes and top_level_nodes[var_name].component_type == "variable":
-					containing_function = self._find_containing_function_or_method(node, top_level_nodes)
-					if containing_function and containing_function != var_name:
-						containing_function_id = self._get_component_id_for_function(containing_function, top_level_nodes)
-						self.call_relationships.append(CallRelationship(
-							caller=containing_function_id,
-							callee=var_name,
-							call_line=node.start_point[0]+1,
-							relationship_type="uses"
-						))
+		if node_type in ["class", "struct", "function"]:
+			self.nodes.append(node_obj)
+	
+	def _get_source_lines(self, node) -> str:
+		"""Return the full source lines spanned by node, sliced straight from the source bytes."""
+		source_bytes = self.source_bytes
+		# tree-sitter columns are byte offsets, so the line starts `column` bytes earlier
+		start = node.start_byte - node.start_point[1]
+		end = source_bytes.find(b"\n", node.end_byte)
+		if end == -1:
+			end = len(source_bytes)
+		return source_bytes[start:end].decode("utf8").rstrip("\r")
+	
+	def _resolve_record(self, record, top_level_nodes):
+		"""Turn a relationship record from _walk into a CallRelationship, if it refers to a known target."""
+		kind, caller, target, call_line = record
 		
-		# Recursively process children
-		for child in node.children:
-			self._extract_relationships(child, top_level_nodes)
-
-	def _find_containing_function(self, node, top_level_nodes):
-		"""Find the function that contains this node."""
-		current = node.parent
-		while current:
-			if current.type == "function_definition":
-				# Get function name
-				declarator = next((c for c in current.children if c.type == "function_declarator"), None)
-				if declarator:
-					identifier = next((c for c in declarator.children if c.type == "identifier"), None)
-					if identifier:
-						func_name = identifier.text.decode()
-						if func_name in top_level_nodes:
-							return func_name
-			current = current.parent
-		return None
-
-	def _find_containing_function_or_method(self, node, top_level_nodes):
-		"""Find the function or method that contains this node."""
-		current = node.parent
-		while current:
-			if current.type == "function_definition":
-				declarator = next((c for c in current.children if c.type == "function_declarator"), None)
-				if declarator:
-					identifier = next((c for c in declarator.children if c.type == "identifier"), None)
-					if identifier:
-						func_name = identifier.text.decode()
-						return func_name
-			current = current.parent
-		return None
+		if kind == "calls":
+			containing_function_id = self._get_component_id_for_function(caller, top_level_nodes)
+			target_class = self._method_to_class.get(target)
+			
+			if target_class:
+				target_class_id = self._get_component_id(target_class)
+				self._add_relationship(containing_function_id, target_class_id, call_line, "calls")
+			elif target in top_level_nodes:
+				called_function_id = self._get_component_id(target)
+				self._add_relationship(containing_function_id, called_function_id, call_line, "calls")
+		
+		elif kind == "inherits":
+			containing_class_id = self._get_component_id(caller)
+			self._add_relationship(containing_class_id, target, call_line, "inherits")
+		
+		elif kind == "creates":
+			if target in top_level_nodes:
+				containing_function_id = self._get_component_id_for_function(caller, top_level_nodes)
+				class_id = self._get_component_id(target)
+				self._add_relationship(containing_function_id, class_id, call_line, "creates")
+		
+		elif kind == "uses":
+			var_name = target.text.decode()
+			if var_name in top_level_nodes and top_level_nodes[var_name].component_type == "variable":
+				if caller != var_name:
+					containing_function_id = self._get_component_id_for_function(caller, top_level_nodes)
+					self._add_relationship(containing_function_id, var_name, call_line, "uses")
+	
+	def _add_relationship(self, caller, callee, call_line, relationship_type):
+		"""Emit a relationship unless the same edge was already emitted from an earlier line."""
+		key = (caller, callee)
+		if key in self._edge_seen:
+			return
+		self._edge_seen.add(key)
+		self.call_relationships.append(CallRelationship(
+			caller=caller,
+			callee=callee,
+			call_line=call_line,
+			relationship_type=relationship_type
+		))
 
 	def _get_component_id_for_function(self, func_name, top_level_nodes):
 		if func_name in top_level_nodes:
-			node_obj = top_level_nodes[func_name]
-			if hasattr(node_obj, 'class_name') and node_obj.class_name:
-				return self._get_component_id(func_name, node_obj.class_name)
+			# Node always has class_name; it is set only for methods
+			class_name = top_level_nodes[func_name].class_name
+			if class_name:
+				return self._get_component_id(func_name, class_name)
 			else:
 				return self._get_component_id(func_name)
 		return self._get_component_id(func_name)
 
-	def _find_containing_class(self, node):
-		"""Find the class that contains this node."""
-		current = node.parent
-		while current:
-			if current.type == "class_specifier":
-				# Get class name
-				for child in current.children:
-					if child.type == "type_identifier":
-						return child.text.decode()
-			current = current.parent
-		return None
-
 	def _is_system_function(self, func_name: str) -> bool:
 		"""Check if function is a system/library function."""
-		system_functions = {
-			'printf', 'scanf', 'malloc', 'free', 'strlen', 'strcpy', 'strcmp',
-			'cout', 'cin', 'endl', 'std', 'new', 'delete'
-		}
-		return func_name in system_functions
+		return func_name in _SYSTEM_FUNCTIONS
+
+class CppAnalysisCache:
+	"""Persistent SQLite cache of analyzed C++ files.
+	
+	Entries are keyed by file path and a SHA-256 digest of the file content and
+	repo path (together, every input of the analyzer) and hold the nodes and
+	call relationships as JSON, so reading the cache never executes code. An
+	edited file gets a new digest, so stale entries are never returned; bumping
+	SCHEMA_VERSION drops all entries when the analyzer output changes. Safe to
+	share between threads, and between processes through SQLite's own locking.
+	A cache that cannot be read or written is treated as a miss.
+	"""
+	
+	SCHEMA_VERSION = 4
+	
+	def __init__(self, db_path: str):
+		self.db_path = db_path
+		self._lock = threading.Lock()
+		# pool workers write concurrently; wait for the lock instead of failing
+		self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+		with self._lock, self._conn:
+			self._conn.execute("PRAGMA journal_mode=WAL")
+			if self._conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+				self._conn.execute("DROP TABLE IF EXISTS cpp_analysis")
+				self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+			self._conn.execute(
+				"CREATE TABLE IF NOT EXISTS cpp_analysis ("
+				"file_path TEXT, content_sha BLOB, payload TEXT, "
+				"PRIMARY KEY(file_path, content_sha))"
+			)
+	
+	@staticmethod
+	def digest(content: str, repo_path: Optional[str] = None) -> bytes:
+		h = hashlib.sha256(content.encode("utf8"))
+		h.update(b"\0")
+		h.update((repo_path or "").encode("utf8"))
+		return h.digest()
+	
+	def get(self, file_path: str, content_sha: bytes) -> Optional[Tuple[List[Node], List[CallRelationship]]]:
+		try:
+			with self._lock:
+				row = self._conn.execute(
+					"SELECT payload FROM cpp_analysis WHERE file_path = ? AND content_sha = ?",
+					(file_path, content_sha),
+				).fetchone()
+			if row is None:
+				return None
+			payload = json.loads(row[0])
+			return (
+				[Node.model_validate(node) for node in payload["nodes"]],
+				[CallRelationship.model_validate(rel) for rel in payload["call_relationships"]],
+			)
+		except Exception as e:
+			logger.warning(f"Ignoring C++ analysis cache entry for {file_path}: {e}")
+			return None
+	
+	def put(self, file_path: str, content_sha: bytes, nodes: List[Node], call_relationships: List[CallRelationship]):
+		payload = json.dumps({
+			"nodes": [node.model_dump(mode="json") for node in nodes],
+			"call_relationships": [rel.model_dump(mode="json") for rel in call_relationships],
+		}, separators=(",", ":"))
+		try:
+			with self._lock, self._conn:
+				# earlier versions of the file are superseded by this one
+				self._conn.execute("DELETE FROM cpp_analysis WHERE file_path = ?", (file_path,))
+				self._conn.execute(
+					"INSERT OR REPLACE INTO cpp_analysis (file_path, content_sha, payload) VALUES (?, ?, ?)",
+					(file_path, content_sha, payload),
+				)
+		except sqlite3.Error as e:
+			logger.warning(f"Could not cache C++ analysis of {file_path}: {e}")
+	
+	def close(self):
+		with self._lock:
+			self._conn.close()
+
+# db_path -> cache opened by this process (None if it could not be opened);
+# pool workers each open their own
+_open_caches: Dict[str, Optional[CppAnalysisCache]] = {}
+_open_caches_lock = threading.Lock()
 
-	def _find_class_containing_method(self, method_name, top_level_nodes):
-		for node_name, node_obj in top_level_nodes.items():
-			if node_obj.component_type in ["class", "struct"]:
-				if self._class_has_method(node_obj, method_name):
-					return node_name
-		return None
 
-	def _class_has_method(self, class_node, method_name):
-		lines = class_node.source_code.split('\n')
-		for line in lines:
-			if f'{method_name}(' in line and ('void' in line or 'int' in line or 'bool' in line or class_node.name in line):
-				return True
-		return False
+def get_analysis_cache(db_path: str) -> Optional[CppAnalysisCache]:
+	"""Return this process's cache for db_path, opening it on first use; None if it cannot be opened."""
+	with _open_caches_lock:
+		if db_path not in _open_caches:
+			try:
+				_open_caches[db_path] = CppAnalysisCache(db_path)
+			except sqlite3.Error as e:
+				logger.warning(f"C++ analysis cache {db_path} unavailable: {e}")
+				_open_caches[db_path] = None
+		return _open_caches[db_path]
 
-def analyze_cpp_file(file_path: str, content: str, repo_path: str = None) -> Tuple[List[Node], List[CallRelationship]]:
+def analyze_cpp_file(
+	file_path: str, content: str, repo_path: str = None, cache: Optional[CppAnalysisCache] = None
+) -> Tuple[List[Node], List[CallRelationship]]:
+	if cache is not None:
+		file_key = str(file_path)
+		content_sha = CppAnalysisCache.digest(content, repo_path)
+		cached = cache.get(file_key, content_sha)
+		if cached is not None:
+			return cached
+	
 	analyzer = TreeSitterCppAnalyzer(file_path, content, repo_path)
+	
+	if cache is not None:
+		cache.put(file_key, content_sha, analyzer.nodes, analyzer.call_relationships)
 	return analyzer.nodes, analyzer.call_relationships
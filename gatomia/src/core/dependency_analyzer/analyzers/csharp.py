@@ -10,6 +10,11 @@ from gatowiki.src.core.dependency_analyzer.models.core import Node, CallRelation
 
 logger = logging.getLogger(__name__)
 
+_TYPE_DECLARATION_TYPES = frozenset({
+	"class_declaration", "interface_declaration", "struct_declaration",
+	"enum_declaration", "record_declaration", "delegate_declaration",
+})
+
 class TreeSitterCSharpAnalyzer:
 	def __init__(self, file_path: str, content: str, repo_path: str = None):
 		self.file_path = Path(file_path)
@@ -17,17 +22,13 @@ class TreeSitterCSharpAnalyzer:
 		self.repo_path = repo_path or ""
 		self.nodes: List[Node] = []
 		self.call_relationships: List[CallRelationship] = []
+		# both paths are fixed per file; compute them once instead of per node
+		self._relative_path = self._get_relative_path()
+		self._module_path = self._get_module_path()
 		self._analyze()
 	
 	def _get_module_path(self) -> str:
-		if self.repo_path:
-			try:
-				rel_path = os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				rel_path = str(self.file_path)
-		else:
-			rel_path = str(self.file_path)
-		
+		rel_path = self._relative_path
 		for ext in ['.cs']:
 			if rel_path.endswith(ext):
 				rel_path = rel_path[:-len(ext)]
@@ -35,16 +36,21 @@ class TreeSitterCSharpAnalyzer:
 		return rel_path.replace('/', '.').replace('\\', '.')
 	
 	def _get_relative_path(self) -> str:
-		if self.repo_path:
-			try:
-				return os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				return str(self.file_path)
-		else:
-			return str(self.file_path)
+		file_path = str(self.file_path)
+		if not self.repo_path:
+			return file_path
+		# fast path: file paths handed in by the call graph analyzer are
+		# already joined onto repo_path, so a prefix strip is enough
+		prefix = self.repo_path.rstrip('/\\') + os.sep
+		if file_path.startswith(prefix):
+			return file_path[len(prefix):]
+		try:
+			return os.path.relpath(file_path, self.repo_path)
+		except ValueError:
+			return file_path
 	
 	def _get_component_id(self, name: str) -> str:
-		module_path = self._get_module_path()
+		module_path = self._module_path
 		return f"{module_path}.{name}" if module_path else name
 
 	def _analyze(self):
@@ -132,13 +138,12 @@ class TreeSitterCSharpAnalyzer:
 		
 		if node_type and node_name:
 			component_id = self._get_component_id(node_name)
-			relative_path = self._get_relative_path()
-			node_obj = Node(
+			node_obj = Node.model_construct(
 				id=component_id,
 				name=node_name,
 				component_type=node_type,
 				file_path=str(self.file_path),
-				relative_path=relative_path,
+				relative_path=self._relative_path,
 				source_code="\n".join(lines[node.start_point[0]:node.end_point[0]+1]),
 				start_line=node.start_point[0]+1,
 				end_line=node.end_point[0]+1,
@@ -157,9 +162,12 @@ class TreeSitterCSharpAnalyzer:
 		for child in node.children:
 			self._extract_nodes(child, top_level_nodes, lines)
 	
-	def _extract_relationships(self, node, top_level_nodes):
-		containing_class = self._find_containing_class(node, top_level_nodes)
+	def _extract_relationships(self, node, top_level_nodes, containing_class=None):
+		"""Extract relationships, threading the enclosing type name down the recursion.
 		
+		containing_class is the nearest enclosing type declaration whose name is a
+		top-level node, which the caller already knows, so no parent walk is needed.
+		"""
 		if node.type == "class_declaration":
 			class_name = self._get_identifier_name_cs(node)
 			if class_name:
@@ -172,7 +180,7 @@ class TreeSitterCSharpAnalyzer:
 							base_name = child.text.decode()
 							if base_name in [n.name for n in top_level_nodes.values()]:
 								base_component_id = self._get_component_id(base_name)
-								self.call_relationships.append(CallRelationship(
+								self.call_relationships.append(CallRelationship.model_construct(
 									caller=class_component_id,
 									callee=base_component_id,
 									call_line=node.start_point[0]+1,
@@ -186,7 +194,7 @@ class TreeSitterCSharpAnalyzer:
 				if len(type_identifiers) >= 2:
 					property_type = type_identifiers[0].text.decode()
 					if property_type and not self._is_primitive_type(property_type):
-						self.call_relationships.append(CallRelationship(
+						self.call_relationships.append(CallRelationship.model_construct(
 							caller=containing_class_id,
 							callee=property_type,  
 							call_line=node.start_point[0]+1,
@@ -200,7 +208,7 @@ class TreeSitterCSharpAnalyzer:
 				if type_node:
 					field_type = type_node.text.decode()
 					if field_type and not self._is_primitive_type(field_type):
-						self.call_relationships.append(CallRelationship(
+						self.call_relationships.append(CallRelationship.model_construct(
 							caller=containing_class_id,
 							callee=field_type, 
 							call_line=node.start_point[0]+1,
@@ -218,16 +226,22 @@ class TreeSitterCSharpAnalyzer:
 							if type_node:
 								param_type = type_node.text.decode()
 								if param_type and not self._is_primitive_type(param_type):
-									self.call_relationships.append(CallRelationship(
+									self.call_relationships.append(CallRelationship.model_construct(
 										caller=containing_class_id,
 										callee=param_type,  
 										call_line=node.start_point[0]+1,
 										is_resolved=False  
 									))
 		
+		# Children of a (known) type declaration are contained by it
+		if node.type in _TYPE_DECLARATION_TYPES:
+			class_name = self._get_identifier_name_cs(node)
+			if class_name and class_name in top_level_nodes:
+				containing_class = class_name
+		
 		# Recursively process children
 		for child in node.children:
-			self._extract_relationships(child, top_level_nodes)
+			self._extract_relationships(child, top_level_nodes, containing_class)
 	
 	def _is_primitive_type(self, type_name: str) -> bool:
 		"""Check if type is a C# primitive or common built-in type."""
@@ -281,16 +295,6 @@ class TreeSitterCSharpAnalyzer:
 			return node.text.decode()
 		return None
 	
-	def _find_containing_class(self, node, top_level_nodes):
-		current = node.parent
-		while current:
-			if current.type in ["class_declaration", "interface_declaration", "struct_declaration", "enum_declaration", "record_declaration", "delegate_declaration"]:
-				class_name = self._get_identifier_name_cs(current)
-				if class_name and class_name in top_level_nodes:
-					return class_name
-			current = current.parent
-		return None
-	
 def analyze_csharp_file(file_path: str, content: str, repo_path: str = None) -> Tuple[List[Node], List[CallRelationship]]:
 	analyzer = TreeSitterCSharpAnalyzer(file_path, content, repo_path)
 	return analyzer.nodes, analyzer.call_relationships
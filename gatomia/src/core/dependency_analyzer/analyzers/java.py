@@ -1,15 +1,77 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 from pathlib import Path
 import sys
 import os
+import threading
 
-from tree_sitter import Parser, Language
+import tree_sitter
+from tree_sitter import Parser, Language, Query
 import tree_sitter_java
 from gatowiki.src.core.dependency_analyzer.models.core import Node, CallRelationship
 
 logger = logging.getLogger(__name__)
 
+# tree-sitter < 0.25 has no QueryCursor and runs captures on the Query itself
+_QUERY_CURSOR: Optional[type] = getattr(tree_sitter, "QueryCursor", None)
+
+# Declarations that open a class scope, mapped to the component type they emit
+# (class_declaration is refined to "abstract class" when marked abstract).
+_CLASS_LIKE_TYPES = {
+	"class_declaration": "class",
+	"interface_declaration": "interface",
+	"enum_declaration": "enum",
+	"record_declaration": "record",
+	"annotation_type_declaration": "annotation",
+}
+
+# Child types that may appear several times under one node; _child_by_type keeps
+# all of them instead of only the first.
+_REPEATABLE_CHILD_TYPES = frozenset({"modifier", "variable_declarator", "formal_parameter"})
+
+# Every node the analyzer acts on; one query collects them all in a single
+# native pass so the rest of the tree is never visited from Python. Declarations
+# and expressions are only captured in the shapes that can yield a relationship
+# (a class-typed variable, field or creation, or a call on a named object), so
+# primitive locals and unqualified or chained calls are pruned before Python.
+_JAVA_NODES_QUERY = """
+[
+	(class_declaration)
+	(interface_declaration)
+	(enum_declaration)
+	(record_declaration)
+	(annotation_type_declaration)
+	(method_declaration)
+	(constructor_declaration)
+	(local_variable_declaration type: [(type_identifier) (generic_type)])
+	(field_declaration type: [(type_identifier) (generic_type)])
+	(object_creation_expression type: [(type_identifier) (generic_type)])
+	(method_invocation object: (identifier) name: (identifier))
+] @node
+"""
+
+_JAVA_LANGUAGE = Language(tree_sitter_java.language())
+_JAVA_NODES = Query(_JAVA_LANGUAGE, _JAVA_NODES_QUERY)
+
+# A Parser is reusable across files but must not run two parses at once, so
+# each thread lazily gets its own.
+_parser_local = threading.local()
+
+
+def _get_java_parser() -> Parser:
+	parser = getattr(_parser_local, "parser", None)
+	if parser is None:
+		parser = _parser_local.parser = Parser(_JAVA_LANGUAGE)
+	return parser
+
+# Java primitives and common built-in types that are not worth tracking as dependencies
+_JAVA_PRIMITIVES = frozenset({
+	"boolean", "byte", "char", "double", "float", "int", "long", "short",
+	"Boolean", "Byte", "Character", "Double", "Float", "Integer", "Long", "Short",
+	"String", "Object", "List", "Set", "Map", "Collection", "Optional",
+	"void", "Void"
+})
+
 class TreeSitterJavaAnalyzer:
 	def __init__(self, file_path: str, content: str, repo_path: str = None):
 		self.file_path = Path(file_path)
@@ -17,17 +79,17 @@ class TreeSitterJavaAnalyzer:
 		self.repo_path = repo_path or ""
 		self.nodes: List[Node] = []
 		self.call_relationships: List[CallRelationship] = []
+		# (caller, callee, call_line) already emitted; a file repeats the same
+		# reference often, e.g. a field initialized with `new` of its own type
+		self._rel_seen: Set[Tuple[str, str, int]] = set()
+		# fixed per file; computed once instead of on every node/relationship
+		self._file_path_str = str(self.file_path)
+		self._relative_path = self._get_relative_path()
+		self._module_path = self._get_module_path()
 		self._analyze()
 	
 	def _get_module_path(self) -> str:
-		if self.repo_path:
-			try:
-				rel_path = os.path.relpath(str(self.file_path), self.repo_path)
-			except ValueError:
-				rel_path = str(self.file_path)
-		else:
-			rel_path = str(self.file_path)
-		
+		rel_path = self._relative_path
 		for ext in ['.java']:
 			if rel_path.endswith(ext):
 				rel_path = rel_path[:-len(ext)]
@@ -38,319 +100,306 @@ class TreeSitterJavaAnalyzer:
 		"""Get relative path from repo root."""
 		if self.repo_path:
 			try:
-				return os.path.relpath(str(self.file_path), self.repo_path)
+				return os.path.relpath(self._file_path_str, self.repo_path)
 			except ValueError:
-				return str(self.file_path)
+				return self._file_path_str
 		else:
-			return str(self.file_path)
+			return self._file_path_str
 	
 	def _get_component_id(self, name: str, parent_class: str = None) -> str:
-		module_path = self._get_module_path()
+		module_path = self._module_path
 		if parent_class:
 			return f"{module_path}.{parent_class}.{name}"
 		else:
 			return f"{module_path}.{name}"
 
 	def _analyze(self):
-		language_capsule = tree_sitter_java.language()
-		java_language = Language(language_capsule)
-		parser = Parser(java_language)
-		tree = parser.parse(bytes(self.content, "utf8"))
-		root = tree.root_node
-		lines = self.content.splitlines()
+		self.source_bytes = bytes(self.content, "utf8")
+		tree = _get_java_parser().parse(self.source_bytes)
+		# decoded text per tree-sitter node id; modifiers and type names are
+		# read again when a node is indexed by more than one handler
+		self._text_cache = {}
 		
-		top_level_nodes = {}
+		# Nodes are identified by their index in self.nodes while analyzing;
+		# name_to_intid maps a top-level name to the latest node emitted for it.
+		name_to_intid = {}
 		
-		self._extract_nodes(root, top_level_nodes, lines)
+		# single pass: emits nodes and relationships together
+		records = self._walk(tree.root_node, name_to_intid)
 		
-		self._extract_relationships(root, top_level_nodes)
+		# Resolve every record to string component ids in one pass. Method-call
+		# targets depend on every top-level name in the file, including ones
+		# declared after the call, so they can only be settled here.
+		nodes = self.nodes
+		for caller_intid, callee, call_line, is_invocation, variable_type in records:
+			if is_invocation:
+				callee = self._resolve_invocation_target(callee, variable_type, name_to_intid)
+				if callee is None:
+					continue
+			self._emit_rel(nodes[caller_intid].id, callee, call_line, False)
+	
+	def _emit_rel(self, caller: str, callee: str, call_line: int, is_resolved: bool):
+		"""Append a CallRelationship unless the same one was already emitted for this file."""
+		key = (caller, callee, call_line)
+		if key in self._rel_seen:
+			return
+		self._rel_seen.add(key)
+		self.call_relationships.append(CallRelationship.model_construct(
+			caller=caller,
+			callee=callee,
+			call_line=call_line,
+			is_resolved=is_resolved
+		))
 	
-	def _extract_nodes(self, node, top_level_nodes, lines):
-		node_type = None
-		node_name = None
+	def _walk(self, root, name_to_intid):
+		"""Process the nodes matched by _JAVA_NODES in source order, tracking the enclosing class and method.
 		
-		if node.type == "class_declaration":
-			is_abstract = any(c.type == "modifier" and c.text.decode() == "abstract" for c in node.children)
-			node_type = "abstract class" if is_abstract else "class"
-			name_node = next((c for c in node.children if c.type == "identifier"), None)
-			node_name = name_node.text.decode() if name_node else None
-		elif node.type == "interface_declaration":
-			node_type = "interface"
-			name_node = next((c for c in node.children if c.type == "identifier"), None)
-			node_name = name_node.text.decode() if name_node else None
-		elif node.type == "enum_declaration":
-			node_type = "enum"
-			name_node = next((c for c in node.children if c.type == "identifier"), None)
-			node_name = name_node.text.decode() if name_node else None
-		elif node.type == "record_declaration":
-			node_type = "record"
-			name_node = next((c for c in node.children if c.type == "identifier"), None)
-			node_name = name_node.text.decode() if name_node else None
-		elif node.type == "annotation_type_declaration":
-			node_type = "annotation"
-			name_node = next((c for c in node.children if c.type == "identifier"), None)
-			node_name = name_node.text.decode() if name_node else None
-		elif node.type == "method_declaration":
-			node_type = "method"
-			name_node = next((c for c in node.children if c.type == "identifier"), None)
-			if name_node:
-				method_name = name_node.text.decode()
-				containing_class = self._find_containing_class_name(node)
-				if containing_class:
-					node_name = f"{containing_class}.{method_name}"
-				else:
-					node_name = method_name
+		Returns relationship records in source order as
+		(caller_intid, callee, call_line, is_invocation, variable_type) tuples. For method
+		invocations callee is the object name, still to be resolved, and variable_type is
+		the declared type of a variable by that name in scope at the call, if any.
+		"""
+		records = []
+		# (end byte, node intid) of the enclosing class-like declarations / methods
+		class_stack = []
+		method_stack = []
+		# (end byte, {variable name: type name}, is_callable) for every enclosing class
+		# (its fields) and method/constructor (its parameters and locals)
+		scope_stack = []
 		
-		if node_type and node_name:
-			component_id = self._get_component_id(node_name)
-			relative_path = self._get_relative_path()
-			node_obj = Node(
-				id=component_id,
-				name=node_name,
-				component_type=node_type,
-				file_path=str(self.file_path),
-				relative_path=relative_path,
-				source_code="\n".join(lines[node.start_point[0]:node.end_point[0]+1]),
-				start_line=node.start_point[0]+1,
-				end_line=node.end_point[0]+1,
-				has_docstring=False,
-				docstring="",
-				parameters=None,
-				node_type=node_type,
-				base_classes=None,
-				class_name=None,
-				display_name=f"{node_type} {node_name}",
-				component_id=component_id
-			)
-			self.nodes.append(node_obj)
-			top_level_nodes[node_name] = node_obj
+		for node in self._query_nodes(root):
+			node_type = node.type
+			
+			# leave the declarations that end before this node
+			start_byte = node.start_byte
+			while class_stack and class_stack[-1][0] <= start_byte:
+				class_stack.pop()
+			while method_stack and method_stack[-1][0] <= start_byte:
+				method_stack.pop()
+			while scope_stack and scope_stack[-1][0] <= start_byte:
+				scope_stack.pop()
+			
+			if node_type in _CLASS_LIKE_TYPES:
+				children = self._child_by_type(node)
+				name_node = children.get("identifier")
+				class_name = self._node_text(name_node) if name_node else None
+				if class_name:
+					if node_type == "class_declaration":
+						is_abstract = any(self._node_text(c) == "abstract" for c in children.get("modifier", ()))
+						component_type = "abstract class" if is_abstract else "class"
+					else:
+						component_type = _CLASS_LIKE_TYPES[node_type]
+					class_intid = self._add_node(node, component_type, class_name, name_to_intid)
+					self._extract_type_relationships(node, children, class_intid, records)
+					class_stack.append((node.end_byte, class_intid))
+					# fields are visible to every method, including ones declared above them
+					fields = {}
+					class_body = children.get("class_body")
+					if class_body:
+						for child in class_body.children:
+							if child.type == "field_declaration":
+								self._declare_variables(child, fields)
+					scope_stack.append((node.end_byte, fields, False))
+			
+			elif node_type == "method_declaration" or node_type == "constructor_declaration":
+				children = self._child_by_type(node)
+				parameters = {}
+				formal_parameters = children.get("formal_parameters")
+				if formal_parameters:
+					for parameter in self._child_by_type(formal_parameters).get("formal_parameter", ()):
+						self._declare_variables(parameter, parameters)
+				scope_stack.append((node.end_byte, parameters, True))
+				
+				name_node = children.get("identifier")
+				if node_type == "method_declaration" and name_node:
+					method_name = self._node_text(name_node)
+					if class_stack:
+						node_name = f"{self.nodes[class_stack[-1][1]].name}.{method_name}"
+						method_intid = self._add_node(node, "method", node_name, name_to_intid)
+						method_stack.append((node.end_byte, method_intid))
+					else:
+						self._add_node(node, "method", method_name, name_to_intid)
+			
+			elif node_type == "local_variable_declaration":
+				if scope_stack and scope_stack[-1][2]:
+					self._declare_variables(node, scope_stack[-1][1])
+			
+			elif class_stack:
+				containing_class_intid = class_stack[-1][1]
+				
+				# Field Type Use: Class has field of another class/interface type
+				# Object Creation: Class instantiates another class/interface
+				if node_type == "field_declaration" or node_type == "object_creation_expression":
+					children = self._child_by_type(node)
+					type_node = children.get("type_identifier") or children.get("generic_type")
+					if type_node:
+						type_name = self._get_type_name(type_node)
+						if type_name and not self._is_primitive_type(type_name):
+							records.append((containing_class_intid, type_name, node.start_point[0]+1, False, None))
+				
+				# Method Calls: Method calls on objects
+				elif node_type == "method_invocation":
+					children = node.children
+					if children and children[0].type == "identifier" and len(children) >= 3 and children[2].type == "identifier":
+						caller_intid = method_stack[-1][1] if method_stack else containing_class_intid
+						object_name = self._node_text(children[0])
+						variable_type = None
+						for _, variables, _ in reversed(scope_stack):
+							if object_name in variables:
+								variable_type = variables[object_name]
+								break
+						records.append((caller_intid, object_name, node.start_point[0]+1, True, variable_type))
 		
-		# Recursively process children
-		for child in node.children:
-			self._extract_nodes(child, top_level_nodes, lines)
+		return records
+	
+	@staticmethod
+	def _query_nodes(root):
+		"""Return the nodes matched by _JAVA_NODES in source order, enclosing nodes first."""
+		if _QUERY_CURSOR is not None:
+			captures = _QUERY_CURSOR(_JAVA_NODES).captures(root)
+		else:
+			captures = _JAVA_NODES.captures(root)
+		nodes = captures.get("node", [])
+		nodes.sort(key=lambda n: (n.start_byte, -n.end_byte))
+		return nodes
+	
+	def _add_node(self, node, node_type, node_name, name_to_intid) -> int:
+		"""Emit a Node and return its intid (its index in self.nodes)."""
+		component_id = self._get_component_id(node_name)
+		node_obj = Node.model_construct(
+			id=component_id,
+			name=node_name,
+			component_type=node_type,
+			file_path=self._file_path_str,
+			relative_path=self._relative_path,
+			source_code=self._get_source_lines(node),
+			start_line=node.start_point[0]+1,
+			end_line=node.end_point[0]+1,
+			has_docstring=False,
+			docstring="",
+			parameters=None,
+			node_type=node_type,
+			base_classes=None,
+			class_name=None,
+			display_name=f"{node_type} {node_name}",
+			component_id=component_id
+		)
+		intid = len(self.nodes)
+		self.nodes.append(node_obj)
+		name_to_intid[node_name] = intid
+		return intid
 	
-	def _extract_relationships(self, node, top_level_nodes):
+	def _get_source_lines(self, node) -> str:
+		"""Return the full source lines spanned by node, sliced straight from the source bytes."""
+		source_bytes = self.source_bytes
+		# tree-sitter columns are byte offsets, so the line starts `column` bytes earlier
+		start = node.start_byte - node.start_point[1]
+		end = source_bytes.find(b"\n", node.end_byte)
+		if end == -1:
+			end = len(source_bytes)
+		return source_bytes[start:end].decode("utf8").rstrip("\r")
+	
+	def _extract_type_relationships(self, node, children, type_intid, records):
+		"""Record inheritance and interface-implementation relationships of a type declaration."""
 		# 1. Inheritance: Class extends another class
 		if node.type == "class_declaration":
-			class_name = self._get_identifier_name(node)
-			children_types = [c.type for c in node.children]
-			
-			extends_node = next((c for c in node.children if c.type == "superclass"), None)
+			extends_node = children.get("superclass")
 			if extends_node:
 				base_class_name = self._get_type_name(extends_node)
-				if class_name and base_class_name and not self._is_primitive_type(base_class_name):
-					caller_id = self._get_component_id(class_name)
+				if base_class_name and not self._is_primitive_type(base_class_name):
 					callee_id = self._get_component_id(base_class_name)  
-					self.call_relationships.append(CallRelationship(
-						caller=caller_id,
-						callee=callee_id,  
-						call_line=node.start_point[0]+1,
-						is_resolved=False  
-					))
+					records.append((type_intid, callee_id, node.start_point[0]+1, False, None))
 			else:
-				logger.debug(f"   No superclass found for {class_name}")
+				logger.debug(f"   No superclass found for {self.nodes[type_intid].name}")
 		
 		# 2. Interface Implementation: Class/enum/record implements interface
 		if node.type in ["class_declaration", "enum_declaration", "record_declaration"]:
-			implementer_name = self._get_identifier_name(node)
-			implements_node = next((c for c in node.children if c.type == "super_interfaces"), None)
-			if implements_node and implementer_name:
+			implements_node = children.get("super_interfaces")
+			if implements_node:
 				for child in implements_node.children:
 					if child.type == "type_list":
 						for type_child in child.children:
 							if type_child.type in ["type_identifier", "generic_type"]:
 								interface_name = self._get_type_name(type_child)
 								if interface_name and not self._is_primitive_type(interface_name):
-									caller_id = self._get_component_id(implementer_name)
 									callee_id = self._get_component_id(interface_name)  
-									self.call_relationships.append(CallRelationship(
-										caller=caller_id,
-										callee=callee_id,  
-										call_line=node.start_point[0]+1,
-										is_resolved=False
-									))
-		
-		# 3. Field Type Use: Class has field of another class/interface type
-		if node.type == "field_declaration":
-			containing_class = self._find_containing_class(node, top_level_nodes)
-			type_node = next((c for c in node.children if c.type in ["type_identifier", "generic_type"]), None)
-			if containing_class and type_node:
-				field_type_name = self._get_type_name(type_node)
-				if field_type_name and not self._is_primitive_type(field_type_name):
-					self.call_relationships.append(CallRelationship(
-						caller=containing_class,
-						callee=field_type_name,  
-						call_line=node.start_point[0]+1,
-						is_resolved=False
-					))
+									records.append((type_intid, callee_id, node.start_point[0]+1, False, None))
+	
+	def _declare_variables(self, declaration, variables):
+		"""Add the variables of a field, local variable or parameter declaration to a scope.
 		
-		# 4. Method Calls: Method calls on objects
-		if node.type == "method_invocation":
-			containing_class = self._find_containing_class(node, top_level_nodes)
-			containing_method = self._find_containing_method(node)
-			if containing_class:
-				object_name = None
-				method_name = None
-				
-				if node.children:
-					first_child = node.children[0]
-					if first_child.type == "identifier":
-						object_name = first_child.text.decode()
-						if len(node.children) >= 3:  
-							method_child = node.children[2]
-							if method_child.type == "identifier":
-								method_name = method_child.text.decode()
-				
-				if object_name and method_name:
-					target_type = None
-					
-					caller_id = containing_method or containing_class
-					
-					if object_name in top_level_nodes:
-						target_type = object_name
-					else:
-						target_type = self._find_variable_type(node, object_name, top_level_nodes)
-
-					if target_type and not self._is_primitive_type(target_type):
-						self.call_relationships.append(CallRelationship(
-							caller=caller_id,
-							callee=target_type,
-							call_line=node.start_point[0]+1,
-							is_resolved=False
-						))
+		The first declaration of a name in a scope wins.
+		"""
+		children = self._child_by_type(declaration)
+		type_node = children.get("type_identifier") or children.get("generic_type")
+		if not type_node:
+			return
+		type_name = self._get_type_name(type_node)
+		if not type_name:
+			return
 		
-		# 5. Object Creation
-		if node.type == "object_creation_expression":
-			containing_class = self._find_containing_class(node, top_level_nodes)
-			type_node = next((c for c in node.children if c.type in ["type_identifier", "generic_type"]), None)
-			if containing_class and type_node:
-				created_type = self._get_type_name(type_node)
-				if created_type and not self._is_primitive_type(created_type):
-					self.call_relationships.append(CallRelationship(
-						caller=containing_class,
-						callee=created_type,
-						call_line=node.start_point[0]+1,
-						is_resolved=False
-					))
+		if declaration.type == "formal_parameter":
+			name_nodes = [children.get("identifier")]
+		else:
+			name_nodes = [
+				next((c for c in declarator.children if c.type == "identifier"), None)
+				for declarator in children.get("variable_declarator", ())
+			]
+		for name_node in name_nodes:
+			if name_node:
+				variables.setdefault(self._node_text(name_node), type_name)
+	
+	def _resolve_invocation_target(self, object_name, variable_type, name_to_intid):
+		"""Return the type a method is invoked on, or None if it isn't a tracked type."""
+		if object_name in name_to_intid:
+			target_type = object_name
+		else:
+			target_type = variable_type
 		
-		# Recursively process children
-		for child in node.children:
-			self._extract_relationships(child, top_level_nodes)
+		if target_type and not self._is_primitive_type(target_type):
+			return target_type
+		return None
 	
 	def _is_primitive_type(self, type_name: str) -> bool:
 		"""Check if type is a Java primitive or common built-in type."""
-		primitives = {
-			"boolean", "byte", "char", "double", "float", "int", "long", "short",
-			"Boolean", "Byte", "Character", "Double", "Float", "Integer", "Long", "Short",
-			"String", "Object", "List", "Set", "Map", "Collection", "Optional",
-			"void", "Void"
-		}
-		return type_name in primitives
+		return type_name in _JAVA_PRIMITIVES
 	
-	def _get_identifier_name(self, node):
-		"""Get identifier name from a node."""
-		name_node = next((c for c in node.children if c.type == "identifier"), None)
-		return name_node.text.decode() if name_node else None
+	def _node_text(self, node) -> str:
+		"""Decode a node's text, at most once per node."""
+		node_id = node.id
+		text = self._text_cache.get(node_id)
+		if text is None:
+			text = node.text.decode()
+			self._text_cache[node_id] = text
+		return text
+	
+	def _child_by_type(self, node):
+		"""Index a node's children by type in a single pass.
+		
+		The first child of each type wins, except for _REPEATABLE_CHILD_TYPES, which
+		map to the list of every matching child.
+		"""
+		by_type = {}
+		for child in node.children:
+			child_type = child.type
+			if child_type in _REPEATABLE_CHILD_TYPES:
+				by_type.setdefault(child_type, []).append(child)
+			elif child_type not in by_type:
+				by_type[child_type] = child
+		return by_type
 	
 	def _get_type_name(self, node):
 		"""Get type name from a type node."""
 		if node.type == "type_identifier":
-			return node.text.decode()
+			return self._node_text(node)
 		elif node.type == "generic_type":
 			type_node = next((c for c in node.children if c.type == "type_identifier"), None)
-			return type_node.text.decode() if type_node else None
+			return self._node_text(type_node) if type_node else None
 		elif node.type == "superclass":
 			type_node = next((c for c in node.children if c.type == "type_identifier"), None)
-			return type_node.text.decode() if type_node else None
-		return None
-	
-	def _find_containing_class(self, node, top_level_nodes):
-		current = node.parent
-		while current:
-			if current.type in ["class_declaration", "interface_declaration", "enum_declaration", "record_declaration", "annotation_type_declaration"]:
-				class_name = self._get_identifier_name(current)
-				if class_name and class_name in top_level_nodes:
-					return self._get_component_id(class_name)  
-			current = current.parent
-		return None
-	
-	def _find_variable_type(self, node, variable_name, top_level_nodes):
-		method_node = node.parent
-		while method_node and method_node.type != "method_declaration":
-			method_node = method_node.parent
-		
-		if method_node:
-			for child in method_node.children:
-				if child.type == "block":
-					variable_type = self._search_variable_declaration(child, variable_name)
-					if variable_type:
-						return variable_type
-		
-		class_node = node.parent
-		while class_node and class_node.type != "class_declaration":
-			class_node = class_node.parent
-			
-		if class_node:
-			for child in class_node.children:
-				if child.type == "class_body":
-					for body_child in child.children:
-						if body_child.type == "field_declaration":
-							identifier_node = None
-							type_node = None
-							for field_child in body_child.children:
-								if field_child.type in ["type_identifier", "generic_type"]:
-									type_node = field_child
-								elif field_child.type == "variable_declarator":
-									identifier_node = next((c for c in field_child.children if c.type == "identifier"), None)
-							
-							if identifier_node and type_node and identifier_node.text.decode() == variable_name:
-								field_type = self._get_type_name(type_node)
-								return field_type
-		
-		return None
-	
-	def _search_variable_declaration(self, block_node, variable_name):
-		for child in block_node.children:
-			if child.type == "local_variable_declaration":
-				type_node = None
-				identifier_node = None
-				for decl_child in child.children:
-					if decl_child.type in ["type_identifier", "generic_type"]:
-						type_node = decl_child
-					elif decl_child.type == "variable_declarator":
-						identifier_node = next((c for c in decl_child.children if c.type == "identifier"), None)
-				
-				if identifier_node and type_node and identifier_node.text.decode() == variable_name:
-					return self._get_type_name(type_node)
-			
-			elif child.type == "block":
-				result = self._search_variable_declaration(child, variable_name)
-				if result:
-					return result
-		
+			return self._node_text(type_node) if type_node else None
 		return None
 	
-	def _find_containing_class_name(self, node):
-		current = node.parent
-		while current:
-			if current.type in ["class_declaration", "interface_declaration", "enum_declaration", "record_declaration"]:
-				name_node = next((c for c in current.children if c.type == "identifier"), None)
-				if name_node:
-					return name_node.text.decode()
-			current = current.parent
-		return None
-	
-	def _find_containing_method(self, node):
-		current = node.parent
-		while current:
-			if current.type == "method_declaration":
-				method_name = self._get_identifier_name(current)
-				class_name = self._find_containing_class_name(current)
-				if method_name and class_name:
-					return self._get_component_id(f"{class_name}.{method_name}")
-			current = current.parent
-		return None
-
 def analyze_java_file(file_path: str, content: str, repo_path: str = None) -> Tuple[List[Node], List[CallRelationship]]:
 	analyzer = TreeSitterJavaAnalyzer(file_path, content, repo_path)
 	return analyzer.nodes, analyzer.call_relationships
\ No newline at end of file
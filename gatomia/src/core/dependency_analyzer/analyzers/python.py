@@ -1,7 +1,7 @@
 import ast
 import logging
 import warnings
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import sys
 import os
@@ -11,8 +11,18 @@ from gatowiki.src.core.dependency_analyzer.models.core import Node, CallRelation
 
 logger = logging.getLogger(__name__)
 
+# Built-in callables that are never recorded as call targets
+_PYTHON_BUILTINS = frozenset({
+    "print", "len", "str", "int", "float", "bool", "list", "dict", "tuple", "set",
+    "range", "enumerate", "zip", "isinstance", "hasattr", "getattr", "setattr",
+    "open", "super", "__import__", "type", "object", "Exception", "ValueError",
+    "TypeError", "KeyError", "IndexError", "AttributeError", "ImportError",
+    "max", "min", "sum", "abs", "round", "sorted", "reversed", "filter", "map",
+    "any", "all", "next", "iter", "callable", "repr", "format", "exec", "eval"
+})
 
-class PythonASTAnalyzer(ast.NodeVisitor):
+
+class PythonASTAnalyzer:
 
     def __init__(self, file_path: str, content: str, repo_path: Optional[str] = None):
         """
@@ -26,64 +36,131 @@ class PythonASTAnalyzer(ast.NodeVisitor):
         self.file_path = file_path
         self.repo_path = repo_path
         self.content = content
-        self.lines = content.splitlines()
+        self._line_offsets = self._compute_line_offsets(content)
         self.nodes: List[Node] = []
         self.call_relationships: List[CallRelationship] = []
-        self.current_class_name: str | None = None
-        self.current_function_name: str | None = None
         
-        self.top_level_nodes = {}
+        self.top_level_nodes: Dict[str, Node] = {}
+
+        # Fixed per file; computed once instead of for every node and call
+        self._file_path_str: str = str(file_path)
+        self._relative_path: str = self._get_relative_path()
+        self._module_path: str = self._get_module_path()
+        # every component id in the file starts with this
+        self._module_prefix: str = self._module_path + "."
     
+    @staticmethod
+    def _compute_line_offsets(content: str) -> List[int]:
+        """Return the character offset at which each line of content starts."""
+        offsets = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+        return offsets
+
+    def _get_source_lines(self, start_line: int, end_line: Optional[int]) -> str:
+        """Return the full source lines start_line..end_line as a single slice of the content."""
+        offsets = self._line_offsets
+        start = offsets[start_line - 1]
+        end_line = end_line or start_line
+        end = offsets[end_line] - 1 if end_line < len(offsets) else len(self.content)
+        return self.content[start:end].rstrip("\r")
+
+    def _fill_source_code(self) -> None:
+        """
+        Materialize source_code for the emitted nodes from their line ranges.
+
+        Done once after the traversal so that only nodes that are kept pay for
+        slicing their source out of the file content.
+        """
+        for node in self.nodes:
+            node.source_code = self._get_source_lines(node.start_line, node.end_line)
+
     def _get_relative_path(self) -> str:
         """Get relative path from repo root."""
         if self.repo_path:
-            return os.path.relpath(self.file_path, self.repo_path)
-        return str(self.file_path)
+            try:
+                return os.path.relpath(self._file_path_str, self.repo_path)
+            except ValueError:
+                return self._file_path_str
+        return self._file_path_str
 
     def _get_module_path(self) -> str:
-        try:
-            relative_path = self._get_relative_path()
-            path = relative_path
-            for ext in ['.py', '.pyx']:
-                if path.endswith(ext):
-                    path = path[:-len(ext)]
-                    break
-            return path.replace('/', '.').replace('\\', '.')
-        except:
-            return str(self.file_path).replace('/', '.').replace('\\', '.')
+        path = self._relative_path
+        for ext in ['.py', '.pyx']:
+            if path.endswith(ext):
+                path = path[:-len(ext)]
+                break
+        return path.replace('/', '.').replace('\\', '.')
     
-    def _get_component_id(self, name: str) -> str:
+    def _get_component_id(self, name: str, class_name: Optional[str] = None) -> str:
         """Generate dot-separated component ID."""
-        module_path = self._get_module_path()
-        if self.current_class_name:
-            return f"{module_path}.{self.current_class_name}.{name}"
+        if class_name:
+            return self._module_prefix + class_name + "." + name
         else:
-            return f"{module_path}.{name}"
+            return self._module_prefix + name
 
-    def generic_visit(self, node):
-        """Override generic_visit to continue AST traversal."""
-        super().generic_visit(node)
+    def _walk(self, tree: ast.AST) -> None:
+        """
+        Traverse the tree depth-first in source order with an explicit stack.
 
-    def visit_ClassDef(self, node: ast.ClassDef):
-        """Visit class definition and add to top-level nodes."""
+        Each entry carries the name of the enclosing function, so leaving a
+        nested def restores the outer function for the calls that follow it.
 
-        base_classes = [self._extract_base_class_name(base) for base in node.bases]
-        base_classes = [name for name in base_classes if name is not None]
-        
-        component_id = f"{self._get_module_path()}.{node.name}"
-        relative_path = self._get_relative_path()
+        The current class keeps the original visitor's rule: it is set on
+        entering a class and cleared on leaving any class, so defs after a
+        nested class are reported as top-level functions and their calls are
+        attributed to them. A ``None`` entry marks the end of a class subtree.
+        """
+        process_call = self._process_call_node
+        process_class = self._process_class_node
+        process_function = self._process_function_node
+        iter_child_nodes = ast.iter_child_nodes
+
+        class_name: Optional[str] = None
+        stack: List[Tuple[Optional[ast.AST], Optional[str]]] = [(tree, None)]
+        while stack:
+            node, function_name = stack.pop()
+            if node is None:
+                class_name = None
+                continue
+            if type(node) is ast.Call:
+                process_call(node, class_name, function_name)
+            elif type(node) is ast.FunctionDef or type(node) is ast.AsyncFunctionDef:
+                process_function(node, class_name)
+                function_name = node.name
+            elif type(node) is ast.ClassDef:
+                process_class(node)
+                class_name = node.name
+                stack.append((None, None))
+
+            children = list(iter_child_nodes(node))
+            children.reverse()
+            stack.extend([(child, function_name) for child in children])
+
+    def _process_class_node(self, node: ast.ClassDef) -> None:
+        """Process class definition and add to top-level nodes."""
+
+        base_classes: List[str] = []
+        for base in node.bases:
+            base_name = self._extract_base_class_name(base)
+            if base_name is not None:
+                base_classes.append(base_name)
         
-        class_node = Node(
+        component_id = self._module_prefix + node.name
+        docstring = ast.get_docstring(node) or ""
+
+        class_node = Node.model_construct(
             id=component_id,
             name=node.name,
             component_type="class",
-            file_path=str(self.file_path),
-            relative_path=relative_path,
-            source_code="\n".join(self.lines[node.lineno - 1 : node.end_lineno or node.lineno]),
+            file_path=self._file_path_str,
+            relative_path=self._relative_path,
             start_line=node.lineno,
-            end_line=node.end_lineno,
-            has_docstring=bool(ast.get_docstring(node)),
-            docstring=ast.get_docstring(node) or "",
+            end_line=node.end_lineno or node.lineno,
+            has_docstring=bool(docstring),
+            docstring=docstring,
             parameters=None,
             node_type="class",
             base_classes=base_classes if base_classes else None,
@@ -96,24 +173,20 @@ class PythonASTAnalyzer(ast.NodeVisitor):
 
         for base_name in base_classes:
             if base_name in self.top_level_nodes:
-                self.call_relationships.append(CallRelationship(
+                self.call_relationships.append(CallRelationship.model_construct(
                     caller=component_id,
-                    callee=f"{self._get_module_path()}.{base_name}",
+                    callee=self._module_prefix + base_name,
                     call_line=node.lineno,
                     is_resolved=True
                 ))
-
-        self.current_class_name = node.name
-        self.generic_visit(node)
-        self.current_class_name = None
     
-    def _extract_base_class_name(self, base):
+    def _extract_base_class_name(self, base: ast.expr) -> Optional[str]:
         """Extract base class name from AST node."""
         if isinstance(base, ast.Name):
             return base.id
         elif isinstance(base, ast.Attribute):
-            parts = []
-            node = base
+            parts: List[str] = []
+            node: ast.expr = base
             while isinstance(node, ast.Attribute):
                 parts.append(node.attr)
                 node = node.value
@@ -122,24 +195,23 @@ class PythonASTAnalyzer(ast.NodeVisitor):
             return ".".join(reversed(parts))
         return None
 
-    def _process_function_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+    def _process_function_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef, class_name: Optional[str]) -> None:
         """Process function definition - only add to nodes if it's top-level."""
 
-        if not self.current_class_name:
-            component_id = f"{self._get_module_path()}.{node.name}"
-            relative_path = self._get_relative_path()
-            
-            func_node = Node(
+        if not class_name:
+            component_id = self._module_prefix + node.name
+            docstring = ast.get_docstring(node) or ""
+
+            func_node = Node.model_construct(
                 id=component_id,
                 name=node.name,
                 component_type="function",
-                file_path=str(self.file_path),
-                relative_path=relative_path,
-                source_code="\n".join(self.lines[node.lineno - 1 : node.end_lineno or node.lineno]),
+                file_path=self._file_path_str,
+                relative_path=self._relative_path,
                 start_line=node.lineno,
-                end_line=node.end_lineno,
-                has_docstring=bool(ast.get_docstring(node)),
-                docstring=ast.get_docstring(node) or "",
+                end_line=node.end_lineno or node.lineno,
+                has_docstring=bool(docstring),
+                docstring=docstring,
                 parameters=[arg.arg for arg in node.args.args],
                 node_type="function",
                 base_classes=None,
@@ -151,40 +223,27 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                 self.nodes.append(func_node)
                 self.top_level_nodes[node.name] = func_node
 
-        self.current_function_name = node.name
-        self.generic_visit(node)
-        self.current_function_name = None
-
     def _should_include_function(self, func: Node) -> bool:
         if func.name.startswith("_test_"):
             return False
         return True
 
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        """Visit function definition and extract function information."""
-        self._process_function_node(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        """Visit async function definition and extract function information."""
-        self._process_function_node(node)
+    def _process_call_node(self, node: ast.Call, class_name: Optional[str], function_name: Optional[str]) -> None:
+        """Process function call nodes and record relationships between top-level nodes."""
 
-    def visit_Call(self, node: ast.Call):
-        """Visit function call nodes and record relationships between top-level nodes."""
-
-        if self.current_class_name or (self.current_function_name and not self.current_class_name):
+        # inside a class the class is the caller, otherwise the enclosing function
+        caller_name = class_name or function_name
+        if caller_name:
             call_name = self._get_call_name(node.func)
             if call_name:
-                if self.current_class_name:
-                    caller_id = f"{self._get_module_path()}.{self.current_class_name}"
-                else:
-                    caller_id = f"{self._get_module_path()}.{self.current_function_name}"
+                caller_id = self._module_prefix + caller_name
                 
                 if call_name in self.top_level_nodes:
-                    callee_id = f"{self._get_module_path()}.{call_name}"
+                    callee_id = self._module_prefix + call_name
                 else:
                     callee_id = call_name
                 
-                relationship = CallRelationship(
+                relationship = CallRelationship.model_construct(
                     caller=caller_id,
                     callee=callee_id,
                     call_line=node.lineno,
@@ -192,29 +251,18 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                 )
                 self.call_relationships.append(relationship)
 
-        self.generic_visit(node)
-
-    def _get_call_name(self, node) -> str | None:
+    def _get_call_name(self, node: ast.expr) -> Optional[str]:
         """
         Extract function name from a call node.
         Handles simple names, attributes (obj.method), and filters built-ins.
         """
-        PYTHON_BUILTINS = {
-            "print", "len", "str", "int", "float", "bool", "list", "dict", "tuple", "set",
-            "range", "enumerate", "zip", "isinstance", "hasattr", "getattr", "setattr",
-            "open", "super", "__import__", "type", "object", "Exception", "ValueError",
-            "TypeError", "KeyError", "IndexError", "AttributeError", "ImportError",
-            "max", "min", "sum", "abs", "round", "sorted", "reversed", "filter", "map",
-            "any", "all", "next", "iter", "callable", "repr", "format", "exec", "eval"
-        }
-
         if isinstance(node, ast.Name):
-            if node.id in PYTHON_BUILTINS:
+            if node.id in _PYTHON_BUILTINS:
                 return None
             return node.id
         elif isinstance(node, ast.Attribute):
             if isinstance(node.value, ast.Name):
-                if node.value.id in PYTHON_BUILTINS:
+                if node.value.id in _PYTHON_BUILTINS:
                     return None
                 return f"{node.value.id}.{node.attr}"
             elif isinstance(node.value, ast.Attribute):
@@ -224,7 +272,7 @@ class PythonASTAnalyzer(ast.NodeVisitor):
             return node.attr
         return None
 
-    def analyze(self):
+    def analyze(self) -> None:
         """Analyze the Python file and extract functions and relationships."""
 
         try:
@@ -232,8 +280,9 @@ class PythonASTAnalyzer(ast.NodeVisitor):
             # These warnings come from regex patterns like '\(' or '\.' in the analyzed files
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", category=SyntaxWarning)
-                tree = ast.parse(self.content)
-            self.visit(tree)
+                tree = ast.parse(self.content, filename=self._file_path_str, type_comments=False)
+            self._walk(tree)
+            self._fill_source_code()
 
             logger.debug(
                 f"Python analysis complete for {self.file_path}: {len(self.nodes)} nodes, "
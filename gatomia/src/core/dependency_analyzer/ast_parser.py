@@ -1,5 +1,4 @@
 import os
-import json
 import logging
 import argparse
 from dataclasses import dataclass, field
@@ -9,6 +8,7 @@ import re
 
 from gatowiki.src.core.dependency_analyzer.analysis.analysis_service import AnalysisService
 from gatowiki.src.core.dependency_analyzer.models.core import Node
+from gatowiki.src.utils import file_manager
 
 
 logger = logging.getLogger(__name__)
@@ -18,12 +18,12 @@ logger.setLevel(logging.DEBUG)
 class DependencyParser:
     """Parser for extracting code components from multi-language repositories."""
     
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, cpp_cache_path: Optional[str] = None):
         self.repo_path = os.path.abspath(repo_path)
         self.components: Dict[str, Node] = {}
         self.modules: Set[str] = set()
         
-        self.analysis_service = AnalysisService()
+        self.analysis_service = AnalysisService(cpp_cache_path=cpp_cache_path)
 
     def parse_repository(self, filtered_folders: List[str] = None) -> Dict[str, Node]:
         logger.debug(f"Parsing repository at {self.repo_path}")
@@ -138,8 +138,7 @@ class DependencyParser:
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        file_manager.save_json(result, output_path)
         
         logger.debug(f"Saved {len(self.components)} components to {output_path}")
         return result
@@ -36,8 +36,13 @@ class DependencyGraphBuilder:
             self.config.dependency_graph_dir, 
             f"{sanitized_repo_name}_filtered_folders.json"
         )
+        # C++ analysis results of unchanged files are reused from earlier runs
+        cpp_cache_path = os.path.join(
+            self.config.dependency_graph_dir,
+            f"{sanitized_repo_name}_cpp_analysis_cache.sqlite"
+        )
 
-        parser = DependencyParser(self.config.repo_path)
+        parser = DependencyParser(self.config.repo_path, cpp_cache_path=cpp_cache_path)
 
         filtered_folders = None
         # if os.path.exists(filtered_folders_path):
@@ -1,5 +1,6 @@
 import logging
 import os
+import shutil
 from typing import Dict, List, Any
 import traceback
 
@@ -93,8 +94,8 @@ class DocumentationGenerator:
                 module_tree = cluster_modules(leaf_nodes, components, self.config)
                 file_manager.save_json(module_tree, first_module_tree_path)
             
-            # Save module tree
-            file_manager.save_json(module_tree, module_tree_path)
+            # Save module tree; it starts out identical to the first module tree
+            shutil.copyfile(first_module_tree_path, module_tree_path)
             logger.info(f"✓ Grouped components into {len(module_tree)} modules")
             
             # Create analysis metadata
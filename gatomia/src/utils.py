@@ -1,7 +1,32 @@
 import os
 import json
+import secrets
+import stat
 from typing import Any, Optional, Dict
 
+# orjson only supports two-space indentation; the stdlib fallback matches it
+JSON_INDENT = 2
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder/decoder
+    def _dumps(data: Any, indent: Optional[int]) -> bytes:
+        if indent:
+            return json.dumps(data, indent=JSON_INDENT, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def _loads(payload: bytes) -> Any:
+        return json.loads(payload)
+else:
+    def _dumps(data: Any, indent: Optional[int]) -> bytes:
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    def _loads(payload: bytes) -> Any:
+        return orjson.loads(payload)
+
 
 # ------------------------------------------------------------
 # ---------------------- File Manager ---------------------
@@ -16,10 +41,57 @@ class FileManager:
         os.makedirs(path, exist_ok=True)
     
     @staticmethod
-    def save_json(data: Any, filepath: str) -> None:
-        """Save data as JSON to file."""
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=4)
+    def save_json(data: Any, filepath: str, indent: Optional[int] = JSON_INDENT) -> None:
+        """
+        Save data as JSON to file; indent=None writes compact JSON for machine-only files.
+
+        The file is replaced atomically: readers and crashes see either the old
+        or the new content, never a partial write.
+        """
+        FileManager._write_atomic(_dumps(data, indent), filepath)
+    
+    @staticmethod
+    def _write_atomic(payload: bytes, filepath: str) -> None:
+        """Write payload to a temp file next to filepath, fsync it, then rename it into place."""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        # Created like a plain open() would: mode 0o666 filtered by the current
+        # umask (unlike mkstemp's 0o600), or the mode of the file being replaced
+        while True:
+            tmp_path = os.path.join(directory, f"{os.path.basename(filepath)}.{secrets.token_hex(8)}.tmp")
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                try:
+                    os.chmod(tmp_path, stat.S_IMODE(os.stat(filepath).st_mode))
+                except FileNotFoundError:
+                    pass
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        # persist the rename itself; directories cannot be opened on Windows.
+        # Best effort: some network/FUSE mounts refuse this, and the file has
+        # already been replaced, so that must not fail the write.
+        if hasattr(os, 'O_DIRECTORY'):
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
     
     @staticmethod
     def load_json(filepath: str) -> Optional[Dict[str, Any]]:
@@ -27,8 +99,8 @@ class FileManager:
         if not os.path.exists(filepath):
             return None
         
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return _loads(f.read())
     
     @staticmethod
     def save_text(content: str, filepath: str) -> None:
@@ -3,16 +3,26 @@
 Cache management for documentation generation results.
 """
 
+import atexit
+import functools
 import hashlib
+import heapq
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 from .models import CacheEntry
 from .config import WebAppConfig
 from gatowiki.src.utils import file_manager
 
 
+@functools.lru_cache(maxsize=1024)
+def _repo_hash(repo_url: str) -> str:
+    """Hash a repository URL; memoized since the same URLs are looked up repeatedly."""
+    return hashlib.sha256(repo_url.encode()).hexdigest()[:16]
+
+
 class CacheManager:
     """Manages documentation cache."""
     
@@ -21,7 +31,15 @@ class CacheManager:
         self.cache_expiry_days = cache_expiry_days or WebAppConfig.CACHE_EXPIRY_DAYS
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_index: Dict[str, CacheEntry] = {}
+        # (created_at, repo_hash) min-heap; entries removed or re-added since are skipped on pop
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # set when the in-memory index has changes not yet written to disk
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        # serializes saves from the flush timer and request threads with the dirty flag
+        self._lock = threading.Lock()
         self.load_cache_index()
+        atexit.register(self.flush)
     
     def load_cache_index(self):
         """Load cache index from disk."""
@@ -39,28 +57,57 @@ class CacheManager:
                     )
             except Exception as e:
                 print(f"Error loading cache index: {e}")
+        
+        self._expiry_heap = [(entry.created_at, key) for key, entry in self.cache_index.items()]
+        heapq.heapify(self._expiry_heap)
     
     def save_cache_index(self):
         """Save cache index to disk."""
         index_file = self.cache_dir / "cache_index.json"
-        try:
-            data = {}
-            for key, entry in self.cache_index.items():
-                data[key] = {
-                    'repo_url': entry.repo_url,
-                    'repo_url_hash': entry.repo_url_hash,
-                    'docs_path': entry.docs_path,
-                    'created_at': entry.created_at.isoformat(),
-                    'last_accessed': entry.last_accessed.isoformat()
-                }
-            
-            file_manager.save_json(data, index_file)
-        except Exception as e:
-            print(f"Error saving cache index: {e}")
+        with self._lock:
+            try:
+                data = {}
+                # snapshot: request threads may update the index while we save
+                for key, entry in list(self.cache_index.items()):
+                    data[key] = {
+                        'repo_url': entry.repo_url,
+                        'repo_url_hash': entry.repo_url_hash,
+                        'docs_path': entry.docs_path,
+                        'created_at': entry.created_at.isoformat(),
+                        'last_accessed': entry.last_accessed.isoformat()
+                    }
+                
+                # only ever read back by load_cache_index; keep it compact
+                file_manager.save_json(data, index_file, indent=None)
+                self._dirty = False
+            except Exception as e:
+                print(f"Error saving cache index: {e}")
+    
+    def flush(self):
+        """Write the cache index if it has unsaved changes."""
+        if self._dirty:
+            self.save_cache_index()
+    
+    def _flush_from_timer(self):
+        """Timer callback: let the next change schedule a new timer, then flush."""
+        with self._lock:
+            self._flush_timer = None
+        self.flush()
+    
+    def _schedule_flush(self):
+        """Mark the index dirty and save it within CACHE_INDEX_FLUSH_SECONDS."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    WebAppConfig.CACHE_INDEX_FLUSH_SECONDS, self._flush_from_timer
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
     
     def get_repo_hash(self, repo_url: str) -> str:
         """Generate hash for repository URL."""
-        return hashlib.sha256(repo_url.encode()).hexdigest()[:16]
+        return _repo_hash(repo_url)
     
     def get_cached_docs(self, repo_url: str) -> Optional[str]:
         """Get cached documentation path if available."""
@@ -71,9 +118,9 @@ class CacheManager:
             
             # Check if cache is still valid
             if datetime.now() - entry.created_at < timedelta(days=self.cache_expiry_days):
-                # Update last accessed
+                # Update last accessed; persisted lazily, not on every read
                 entry.last_accessed = datetime.now()
-                self.save_cache_index()
+                self._schedule_flush()
                 return entry.docs_path
             else:
                 # Cache expired, remove it
@@ -93,6 +140,7 @@ class CacheManager:
             created_at=now,
             last_accessed=now
         )
+        heapq.heappush(self._expiry_heap, (now, repo_hash))
         
         self.save_cache_index()
     
@@ -105,15 +153,17 @@ class CacheManager:
     
     def cleanup_expired_cache(self):
         """Remove expired cache entries."""
-        expired_entries = []
+        expired_count = 0
         cutoff = datetime.now() - timedelta(days=self.cache_expiry_days)
         
-        for repo_hash, entry in self.cache_index.items():
-            if entry.created_at < cutoff:
-                expired_entries.append(repo_hash)
-        
-        for repo_hash in expired_entries:
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            created_at, repo_hash = heapq.heappop(self._expiry_heap)
+            entry = self.cache_index.get(repo_hash)
+            # stale heap item: the entry was removed or replaced after it was pushed
+            if entry is None or entry.created_at != created_at:
+                continue
             del self.cache_index[repo_hash]
+            expired_count += 1
         
-        if expired_entries:
+        if expired_count:
             self.save_cache_index()
\ No newline at end of file
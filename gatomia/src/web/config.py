@@ -20,6 +20,8 @@ class WebAppConfig:
     
     # Cache settings
     CACHE_EXPIRY_DAYS = 365
+    # Delay before access-time updates to the cache index are written to disk
+    CACHE_INDEX_FLUSH_SECONDS = 60
     
     # Job cleanup settings
     JOB_CLEANUP_HOURS = 24000
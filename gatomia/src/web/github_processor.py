@@ -4,12 +4,43 @@ GitHub repository processing utilities.
 """
 
 import os
+import re
+import shutil
 import subprocess
+import time
 from typing import Dict
 from urllib.parse import urlparse
 
+try:
+    import pygit2
+except ImportError:  # clone with the git CLI instead
+    pygit2 = None
+
 from .config import WebAppConfig
 
+if pygit2 is not None:
+    class _DeadlineCallbacks(pygit2.RemoteCallbacks):
+        """Abort a pygit2 transfer once its deadline has passed, like the subprocess timeout."""
+        
+        def __init__(self, deadline: float):
+            super().__init__()
+            self.deadline = deadline
+        
+        def _check_deadline(self) -> None:
+            # raising from a callback makes libgit2 abort and clone_repository re-raise
+            if time.monotonic() > self.deadline:
+                raise TimeoutError(f"clone exceeded {WebAppConfig.CLONE_TIMEOUT}s")
+        
+        def transfer_progress(self, stats) -> None:
+            self._check_deadline()
+        
+        def sideband_progress(self, string: str) -> None:
+            self._check_deadline()
+
+# Canonical https://github.com/<owner>/<repo>[.git][/] form; anything else goes through urlparse.
+# Like urlparse, only the scheme and host are case-insensitive; the path and its .git suffix are not.
+_GITHUB_URL_RE = re.compile(r'^(?i:https?://(?:www\.)?github\.com)/([^/\s?#]+)/(?!\.git/?$)([^/\s?#]+?)(?:\.git)?/?$')
+
 
 class GitHubRepoProcessor:
     """Handles GitHub repository processing."""
@@ -17,6 +48,8 @@ class GitHubRepoProcessor:
     @staticmethod
     def is_valid_github_url(url: str) -> bool:
         """Validate if the URL is a valid GitHub repository URL."""
+        if _GITHUB_URL_RE.match(url):
+            return True
         try:
             parsed = urlparse(url)
             if parsed.netloc.lower() not in ['github.com', 'www.github.com']:
@@ -34,15 +67,19 @@ class GitHubRepoProcessor:
     @staticmethod
     def get_repo_info(url: str) -> Dict[str, str]:
         """Extract repository information from GitHub URL."""
-        parsed = urlparse(url)
-        path_parts = parsed.path.strip('/').split('/')
-        
-        owner = path_parts[0]
-        repo = path_parts[1]
-        
-        # Remove .git suffix if present
-        if repo.endswith('.git'):
-            repo = repo[:-4]
+        match = _GITHUB_URL_RE.match(url)
+        if match:
+            owner, repo = match.groups()
+        else:
+            parsed = urlparse(url)
+            path_parts = parsed.path.strip('/').split('/')
+            
+            owner = path_parts[0]
+            repo = path_parts[1]
+            
+            # Remove .git suffix if present
+            if repo.endswith('.git'):
+                repo = repo[:-4]
         
         return {
             'owner': owner,
@@ -58,11 +95,16 @@ class GitHubRepoProcessor:
             # Ensure target directory exists
             os.makedirs(os.path.dirname(target_dir), exist_ok=True)
             
+            # libgit2 has no partial clone support, so only shallow clones go in-process
+            if not commit_id and GitHubRepoProcessor._clone_with_pygit2(clone_url, target_dir):
+                return True
+            
             # If specific commit is requested, don't use shallow clone
             if commit_id:
-                # Clone full repository to access specific commit
+                # Partial clone: full history but no file contents; checkout
+                # then downloads only the blobs of the requested commit
                 result = subprocess.run([
-                    'git', 'clone', clone_url, target_dir
+                    'git', 'clone', '--filter=blob:none', '--no-checkout', '--no-tags', clone_url, target_dir
                 ], capture_output=True, text=True, timeout=WebAppConfig.CLONE_TIMEOUT)
                 
                 if result.returncode != 0:
@@ -72,7 +114,16 @@ class GitHubRepoProcessor:
                 # Checkout specific commit
                 result = subprocess.run([
                     'git', 'checkout', commit_id
-                ], cwd=target_dir, capture_output=True, text=True, timeout=30)
+                ], cwd=target_dir, capture_output=True, text=True, timeout=WebAppConfig.CLONE_TIMEOUT)
+                
+                if result.returncode != 0:
+                    # Commit not reachable from any branch (e.g. a pull request head); fetch it directly
+                    subprocess.run([
+                        'git', 'fetch', '--depth=1', 'origin', commit_id
+                    ], cwd=target_dir, capture_output=True, text=True, timeout=WebAppConfig.CLONE_TIMEOUT)
+                    result = subprocess.run([
+                        'git', 'checkout', commit_id
+                    ], cwd=target_dir, capture_output=True, text=True, timeout=WebAppConfig.CLONE_TIMEOUT)
                 
                 if result.returncode != 0:
                     print(f"Error checking out commit {commit_id}: {result.stderr}")
@@ -80,7 +131,8 @@ class GitHubRepoProcessor:
             else:
                 # Clone repository with shallow depth (default behavior)
                 result = subprocess.run([
-                    'git', 'clone', '--depth', str(WebAppConfig.CLONE_DEPTH), clone_url, target_dir
+                    'git', 'clone', '--depth', str(WebAppConfig.CLONE_DEPTH), '--single-branch', '--no-tags',
+                    clone_url, target_dir
                 ], capture_output=True, text=True, timeout=WebAppConfig.CLONE_TIMEOUT)
                 
                 if result.returncode != 0:
@@ -90,4 +142,47 @@ class GitHubRepoProcessor:
             return True
         except Exception as e:
             print(f"Error cloning repository: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    @staticmethod
+    def _clone_with_pygit2(clone_url: str, target_dir: str) -> bool:
+        """
+        Shallow clone in-process with pygit2, avoiding a git subprocess.
+        
+        Like the git CLI path, only the default branch is fetched and no tags.
+        Returns False if pygit2 is unavailable or the clone failed, and raises
+        TimeoutError if it ran past CLONE_TIMEOUT.
+        """
+        if pygit2 is None:
+            return False
+        deadline = time.monotonic() + WebAppConfig.CLONE_TIMEOUT
+        try:
+            # Progress callbacks only run while data arrives; the libgit2 socket
+            # timeouts bound a remote that stops sending altogether
+            timeout_ms = WebAppConfig.CLONE_TIMEOUT * 1000
+            pygit2.option(pygit2.enums.Option.SET_SERVER_CONNECT_TIMEOUT, timeout_ms)
+            pygit2.option(pygit2.enums.Option.SET_SERVER_TIMEOUT, timeout_ms)
+            callbacks = _DeadlineCallbacks(deadline)
+            
+            # pygit2.clone_repository always fetches every branch and all tags, so
+            # build the equivalent of `git clone --single-branch --no-tags` by hand
+            repo = pygit2.init_repository(target_dir)
+            heads = repo.remotes.create_anonymous(clone_url).list_heads(callbacks=callbacks)
+            head_ref = next(head.symref_target for head in heads if head.name == 'HEAD' and head.symref_target)
+            branch = head_ref.removeprefix('refs/heads/')
+            repo.remotes.create('origin', clone_url, f'+refs/heads/{branch}:refs/remotes/origin/{branch}')
+            repo.config['remote.origin.tagOpt'] = '--no-tags'
+            repo.remotes['origin'].fetch(callbacks=callbacks, depth=WebAppConfig.CLONE_DEPTH)
+            
+            local_branch = repo.create_branch(branch, repo.revparse_single(f'refs/remotes/origin/{branch}'))
+            local_branch.upstream = repo.branches.remote[f'origin/{branch}']
+            repo.checkout(local_branch)
+            return True
+        except Exception as e:
+            # git clone refuses to write into a non-empty directory
+            shutil.rmtree(target_dir, ignore_errors=True)
+            if time.monotonic() > deadline:
+                # the time budget is spent; retrying with git would double it
+                raise TimeoutError(f"pygit2 clone timed out after {WebAppConfig.CLONE_TIMEOUT}s: {e}") from e
+            print(f"pygit2 clone failed, falling back to git: {e}")
+            return False
@@ -0,0 +1,51 @@
+"""Tests for CacheManager's deferred index writes."""
+
+from gatowiki.src.utils import file_manager
+from gatowiki.src.web import cache_manager as cache_module
+from gatowiki.src.web.cache_manager import CacheManager
+from gatowiki.src.web.config import WebAppConfig
+
+REPO_URL = "https://github.com/owner/repo"
+
+
+def _index(manager):
+    return file_manager.load_json(str(manager.cache_dir / "cache_index.json"))
+
+
+def test_failed_save_keeps_index_dirty(tmp_path, monkeypatch):
+    monkeypatch.setattr(WebAppConfig, "CACHE_INDEX_FLUSH_SECONDS", 3600)
+    manager = CacheManager(cache_dir=str(tmp_path))
+    manager.add_to_cache(REPO_URL, "/docs/repo")
+    assert manager.get_cached_docs(REPO_URL) == "/docs/repo"
+    manager._flush_timer.cancel()
+
+    def refuse(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache_module.file_manager, "save_json", refuse)
+    manager.flush()
+    assert manager._dirty
+
+    monkeypatch.undo()
+    manager.flush()
+    assert not manager._dirty
+    repo_hash = manager.get_repo_hash(REPO_URL)
+    entry = manager.cache_index[repo_hash]
+    assert _index(manager)[repo_hash]["last_accessed"] == entry.last_accessed.isoformat()
+
+
+def test_flush_timer_writes_index_and_rearms(tmp_path, monkeypatch):
+    monkeypatch.setattr(WebAppConfig, "CACHE_INDEX_FLUSH_SECONDS", 0.01)
+    manager = CacheManager(cache_dir=str(tmp_path))
+    manager.add_to_cache(REPO_URL, "/docs/repo")
+
+    for _ in range(2):
+        manager.get_cached_docs(REPO_URL)
+        timer = manager._flush_timer
+        timer.join(5)
+        assert manager._flush_timer is None
+        assert not manager._dirty
+
+    repo_hash = manager.get_repo_hash(REPO_URL)
+    entry = manager.cache_index[repo_hash]
+    assert _index(manager)[repo_hash]["last_accessed"] == entry.last_accessed.isoformat()
@@ -0,0 +1,76 @@
+"""Tests for the tree-sitter C++ analyzer's call-relationship output."""
+
+import textwrap
+
+from gatowiki.src.core.dependency_analyzer.analyzers.cpp import analyze_cpp_file
+
+
+def _relationships(source: str):
+    _, relationships = analyze_cpp_file(
+        "/repo/src/widget.cpp", textwrap.dedent(source), repo_path="/repo"
+    )
+    return [(rel.caller, rel.callee, rel.call_line) for rel in relationships]
+
+
+def test_method_call_resolves_to_declaring_class_including_templated_members():
+    relationships = _relationships(
+        """\
+        class Buffer {
+        public:
+            template <typename T>
+            void push(T value);
+        };
+
+        void run(Buffer& buffer) {
+            buffer.push(1);
+        }
+        """
+    )
+
+    assert relationships == [("src.widget.run", "src.widget.Buffer", 8)]
+
+
+def test_call_named_in_a_class_body_is_not_a_method_of_that_class():
+    relationships = _relationships(
+        """\
+        void log() {}
+
+        class Logger {
+        public:
+            void write() { log(); }
+        };
+
+        void use() {
+            log();
+        }
+        """
+    )
+
+    assert relationships == [("src.widget.use", "src.widget.log", 9)]
+
+
+def test_repeated_edges_are_kept_once_at_their_first_line():
+    relationships = _relationships(
+        """\
+        class Buffer {
+        public:
+            void flush();
+        };
+
+        void helper() {}
+
+        void run() {
+            helper();
+            Buffer* buffer = new Buffer();
+            buffer->flush();
+            helper();
+            buffer->flush();
+        }
+        """
+    )
+
+    # the object creation and the method calls on Buffer collapse into one edge
+    assert relationships == [
+        ("src.widget.run", "src.widget.helper", 9),
+        ("src.widget.run", "src.widget.Buffer", 10),
+    ]
@@ -0,0 +1,128 @@
+"""Tests for GitHubRepoProcessor URL handling and cloning."""
+
+import os
+import types
+from urllib.parse import urlparse
+
+import pytest
+
+from gatowiki.src.web import github_processor
+from gatowiki.src.web.config import WebAppConfig
+from gatowiki.src.web.github_processor import GitHubRepoProcessor
+
+
+def _parse_with_urlparse(url):
+    """Owner/repo as the urlparse fallback path extracts them."""
+    owner, repo = urlparse(url).path.strip('/').split('/')[:2]
+    if repo.endswith('.git'):
+        repo = repo[:-4]
+    return owner, repo
+
+
+@pytest.mark.parametrize("url", [
+    "https://github.com/owner/repo",
+    "https://github.com/owner/repo.git",
+    "https://github.com/owner/repo/",
+    "https://www.github.com/owner/repo.git/",
+    "HTTPS://GitHub.COM/Owner/Repo.git",
+    "https://github.com/owner/repo.GIT",
+    "https://github.com/owner/repo.Git/",
+    "https://github.com/owner/.GIT",
+])
+def test_get_repo_info_matches_urlparse(url):
+    info = GitHubRepoProcessor.get_repo_info(url)
+
+    assert GitHubRepoProcessor.is_valid_github_url(url)
+    assert (info['owner'], info['repo']) == _parse_with_urlparse(url)
+
+
+def test_uppercase_git_suffix_is_part_of_the_repo_name():
+    info = GitHubRepoProcessor.get_repo_info("https://github.com/a/b.GIT")
+
+    assert info['repo'] == "b.GIT"
+    assert info['clone_url'] == "https://github.com/a/b.GIT.git"
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _FakeRemote:
+    def __init__(self, clock, stall_seconds):
+        self.clock = clock
+        self.stall_seconds = stall_seconds
+        self.fetch_depth = None
+
+    def list_heads(self, callbacks=None):
+        return [types.SimpleNamespace(name='HEAD', symref_target='refs/heads/main')]
+
+    def fetch(self, callbacks=None, depth=0):
+        self.fetch_depth = depth
+        callbacks.transfer_progress(None)
+        self.clock.now += self.stall_seconds
+        callbacks.transfer_progress(None)
+
+
+class _FakeRemotes:
+    def __init__(self, remote):
+        self.remote = remote
+        self.refspecs = {}
+
+    def create_anonymous(self, url):
+        return self.remote
+
+    def create(self, name, url, fetch):
+        self.refspecs[name] = fetch
+
+    def __getitem__(self, name):
+        return self.remote
+
+
+@pytest.fixture
+def fake_pygit2(monkeypatch):
+    """The real pygit2 module with its network entry points replaced."""
+    pygit2 = pytest.importorskip("pygit2")
+    clock = _FakeClock()
+    remote = _FakeRemote(clock, stall_seconds=WebAppConfig.CLONE_TIMEOUT + 1)
+    repo = types.SimpleNamespace(remotes=_FakeRemotes(remote), config={})
+    options = []
+
+    def init_repository(path):
+        os.makedirs(path)
+        return repo
+
+    monkeypatch.setattr(github_processor, "time", clock)
+    monkeypatch.setattr(pygit2, "option", lambda option, value: options.append((option, value)))
+    monkeypatch.setattr(pygit2, "init_repository", init_repository)
+    return types.SimpleNamespace(module=pygit2, repo=repo, remote=remote, options=options)
+
+
+def test_pygit2_clone_sets_server_timeouts_and_aborts_past_deadline(fake_pygit2, tmp_path):
+    target_dir = tmp_path / "repo"
+
+    with pytest.raises(TimeoutError):
+        GitHubRepoProcessor._clone_with_pygit2("https://github.com/owner/repo.git", str(target_dir))
+
+    timeout_ms = WebAppConfig.CLONE_TIMEOUT * 1000
+    assert fake_pygit2.options == [
+        (fake_pygit2.module.enums.Option.SET_SERVER_CONNECT_TIMEOUT, timeout_ms),
+        (fake_pygit2.module.enums.Option.SET_SERVER_TIMEOUT, timeout_ms),
+    ]
+    # same refs as `git clone --depth N --single-branch --no-tags`
+    assert fake_pygit2.repo.remotes.refspecs == {'origin': '+refs/heads/main:refs/remotes/origin/main'}
+    assert fake_pygit2.repo.config == {'remote.origin.tagOpt': '--no-tags'}
+    assert fake_pygit2.remote.fetch_depth == WebAppConfig.CLONE_DEPTH
+    assert not target_dir.exists()
+
+
+def test_pygit2_clone_failure_within_deadline_falls_back(fake_pygit2, tmp_path):
+    fake_pygit2.remote.stall_seconds = 0
+    target_dir = tmp_path / "repo"
+
+    # the fake repo has no create_branch, so the clone fails right after the fetch
+    assert GitHubRepoProcessor._clone_with_pygit2("https://github.com/owner/repo.git", str(target_dir)) is False
+    assert not target_dir.exists()
@@ -0,0 +1,51 @@
+"""Tests for the tree-sitter Java analyzer's call-relationship output."""
+
+import textwrap
+
+from gatowiki.src.core.dependency_analyzer.analyzers.java import analyze_java_file
+
+
+def test_invocations_resolve_through_parameters_locals_and_fields():
+    source = textwrap.dedent(
+        """\
+        package app;
+
+        class Repository {
+            void save() {}
+        }
+
+        class Service {
+            Service() {
+                Repository created = new Repository();
+                created.save();
+            }
+
+            void store(Repository param) {
+                param.save();
+                if (param != null) {
+                    Repository inBlock = param;
+                    inBlock.save();
+                }
+                field.save();
+            }
+
+            private Repository field;
+        }
+        """
+    )
+    nodes, relationships = analyze_java_file("/repo/app/Service.java", source, repo_path="/repo")
+
+    assert [node.id for node in nodes] == [
+        "app.Service.Repository",
+        "app.Service.Repository.save",
+        "app.Service.Service",
+        "app.Service.Service.store",
+    ]
+    assert [(rel.caller, rel.callee, rel.call_line) for rel in relationships] == [
+        ("app.Service.Service", "Repository", 9),          # new Repository()
+        ("app.Service.Service", "Repository", 10),         # constructor local
+        ("app.Service.Service.store", "Repository", 14),   # method parameter
+        ("app.Service.Service.store", "Repository", 17),   # local declared in a block
+        ("app.Service.Service.store", "Repository", 19),   # field declared below the method
+        ("app.Service.Service", "Repository", 22),         # field type
+    ]
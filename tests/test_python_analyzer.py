@@ -0,0 +1,72 @@
+"""Tests for the Python AST analyzer's node and call-relationship output."""
+
+import textwrap
+
+from gatowiki.src.core.dependency_analyzer.analyzers.python import analyze_python_file
+
+
+def _analyze(source: str):
+    nodes, relationships = analyze_python_file(
+        "/repo/pkg/mod.py", textwrap.dedent(source), repo_path="/repo"
+    )
+    return (
+        [node.id for node in nodes],
+        [(rel.caller, rel.callee, rel.call_line) for rel in relationships],
+    )
+
+
+def test_def_after_nested_class_is_a_function_node():
+    node_ids, relationships = _analyze(
+        """
+        def helper():
+            pass
+
+        class Outer:
+            class Inner:
+                pass
+
+            def method_after_inner(self):
+                helper()
+        """
+    )
+
+    assert node_ids == ["pkg.mod.helper", "pkg.mod.Outer", "pkg.mod.Inner", "pkg.mod.method_after_inner"]
+    assert relationships == [("pkg.mod.method_after_inner", "pkg.mod.helper", 10)]
+
+
+def test_methods_are_not_function_nodes_and_calls_go_to_the_class():
+    node_ids, relationships = _analyze(
+        """
+        def helper():
+            pass
+
+        class Service:
+            def run(self):
+                helper()
+        """
+    )
+
+    assert node_ids == ["pkg.mod.helper", "pkg.mod.Service"]
+    assert relationships == [("pkg.mod.Service", "pkg.mod.helper", 7)]
+
+
+def test_calls_after_nested_def_are_attributed_to_the_outer_function():
+    node_ids, relationships = _analyze(
+        """
+        def helper():
+            pass
+
+        def outer_function():
+            def nested():
+                helper()
+            nested()
+            helper()
+        """
+    )
+
+    assert node_ids == ["pkg.mod.helper", "pkg.mod.outer_function", "pkg.mod.nested"]
+    assert relationships == [
+        ("pkg.mod.nested", "pkg.mod.helper", 7),
+        ("pkg.mod.outer_function", "pkg.mod.nested", 8),
+        ("pkg.mod.outer_function", "pkg.mod.helper", 9),
+    ]
@@ -0,0 +1,29 @@
+"""Tests for FileManager's JSON persistence."""
+
+import os
+
+from gatowiki.src.utils import file_manager
+
+
+def test_save_json_replaces_file_without_leaving_temp_files(tmp_path):
+    target = tmp_path / "index.json"
+    file_manager.save_json({"a": 1}, str(target))
+    file_manager.save_json({"a": 2, "name": "é"}, str(target), indent=None)
+
+    assert file_manager.load_json(str(target)) == {"a": 2, "name": "é"}
+    assert os.listdir(tmp_path) == ["index.json"]
+
+
+def test_save_json_succeeds_when_directory_fsync_is_refused(tmp_path, monkeypatch):
+    real_open = os.open
+
+    def refuse_directories(path, flags, *args, **kwargs):
+        if flags & getattr(os, "O_DIRECTORY", 0):
+            raise PermissionError("directory open refused by mount")
+        return real_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", refuse_directories)
+    target = tmp_path / "index.json"
+    file_manager.save_json({"a": 1}, str(target))
+
+    assert file_manager.load_json(str(target)) == {"a": 1}